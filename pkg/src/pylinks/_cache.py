@@ -0,0 +1,350 @@
+"""Thread-safe caches with per-entry expiry, optionally persisted on disk.
+
+Caches are kept in memory, and are additionally stored in an SQLite database
+under `pylinks.settings.cache_dir` when that is set,
+so that they can be shared between processes and survive restarts.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import sqlite3 as _sqlite3
+import threading as _threading
+import time as _time
+from pathlib import Path as _Path
+
+from pylinks._settings import settings as _settings
+
+if _TYPE_CHECKING:
+    from typing import Any
+
+
+class TTLCache:
+    """A key-value cache with per-entry time-to-live.
+
+    Values must be JSON-serializable when the cache is persisted.
+    """
+
+    def __init__(self, name: str):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the cache, used as the filename of its database in `settings.cache_dir`.
+        """
+        self.name = name
+        self._memory: dict[str, tuple[Any, float, float | None]] = {}
+        self._lock = _threading.RLock()
+        self._db: _sqlite3.Connection | None = None
+        self._db_path: _Path | None = None
+        return
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value of a non-expired entry, or `default` if there is none."""
+        entry = self.get_entry(key)
+        if entry is None or entry.expired:
+            return default
+        return entry.value
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Get an entry, including its expiry information, even if it is expired."""
+        with self._lock:
+            db = self._connect()
+            entry = self._memory.get(key)
+            if entry is None:
+                if db is None:
+                    return
+                row = db.execute(
+                    "SELECT value, stored, expires FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return
+                entry = self._memory[key] = (_json.loads(row[0]), row[1], row[2])
+        return CacheEntry(*entry)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """
+        Add or replace an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        value : Any
+            Value of the entry.
+        ttl : float, optional
+            Time-to-live of the entry in seconds. If None, the entry never expires.
+        """
+        stored = _time.time()
+        expires = None if ttl is None else stored + ttl
+        with self._lock:
+            self._memory[key] = (value, stored, expires)
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, stored, expires) VALUES (?, ?, ?, ?)",
+                        (key, _json.dumps(value), stored, expires),
+                    )
+        return
+
+    def delete(self, key: str) -> None:
+        """Remove an entry, if it exists."""
+        with self._lock:
+            self._memory.pop(key, None)
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return
+
+    def clear(self, expired_only: bool = False) -> None:
+        """Remove all entries, or only the expired ones."""
+        now = _time.time()
+        with self._lock:
+            if expired_only:
+                self._memory = {
+                    key: entry for key, entry in self._memory.items() if entry[2] is None or entry[2] > now
+                }
+            else:
+                self._memory.clear()
+            db = self._connect()
+            if db is not None:
+                with db:
+                    if expired_only:
+                        db.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,))
+                    else:
+                        db.execute("DELETE FROM entries")
+        return
+
+    def _connect(self) -> _sqlite3.Connection | None:
+        """Get the database connection for the current `settings.cache_dir`, if any."""
+        cache_dir = _settings.cache_dir
+        path = cache_dir / f"{self.name}.sqlite3" if cache_dir else None
+        if path == self._db_path:
+            return self._db
+        if self._db is not None:
+            self._db.close()
+        # Entries in memory may belong to a different database.
+        self._memory.clear()
+        self._db_path = path
+        self._db = None
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = _sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored REAL NOT NULL, expires REAL)"
+            )
+        return self._db
+
+
+class CacheEntry:
+    """An entry of a `TTLCache`."""
+
+    __slots__ = ("value", "stored", "expires")
+
+    def __init__(self, value: Any, stored: float, expires: float | None):
+        self.value = value
+        self.stored = stored
+        self.expires = expires
+        return
+
+    @property
+    def age(self) -> float:
+        """Time (in seconds) since the entry was stored."""
+        return _time.time() - self.stored
+
+    @property
+    def expired(self) -> bool:
+        """Whether the entry's time-to-live has passed."""
+        return self.expires is not None and self.expires <= _time.time()
+
+
+class BlobCache:
+    """A size-bounded, content-addressed cache of large text values, stored on disk.
+
+    Values are stored as files named by the SHA-256 hash of their content
+    in a directory under `pylinks.settings.cache_dir`,
+    so that keys with identical values share a single file.
+    Keys, along with a small JSON-serializable metadata dictionary,
+    are indexed in an SQLite database next to that directory.
+    Nothing is cached when `cache_dir` is not set.
+    """
+
+    def __init__(self, name: str):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the cache, used for its directory and database in `settings.cache_dir`.
+        """
+        self.name = name
+        self._lock = _threading.RLock()
+        self._db: _sqlite3.Connection | None = None
+        self._db_path: _Path | None = None
+        return
+
+    def get(self, key: str) -> tuple[str, dict] | None:
+        """Get the value and metadata of an entry, or None if there is none."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            row = db.execute("SELECT digest, meta FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            try:
+                value = self._blob_path(row[0]).read_text("utf-8")
+            except FileNotFoundError:
+                with db:
+                    db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return
+            with db:
+                db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (_time.time(), key))
+        return value, _json.loads(row[1])
+
+    def set(self, key: str, value: str, meta: dict | None = None, max_size: int | None = None) -> None:
+        """
+        Add or replace an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        value : str
+            Value of the entry.
+        meta : dict, optional
+            Additional JSON-serializable data to store with the entry.
+        max_size : int, optional
+            Maximum total size of all stored values in bytes.
+            If exceeded, least recently used entries are evicted.
+        """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            content = value.encode("utf-8")
+            digest = _hashlib.sha256(content).hexdigest()
+            path = self._blob_path(digest)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_name(f"{path.name}.{_os.getpid()}.{_threading.get_ident()}.tmp")
+                temp_path.write_bytes(content)
+                _os.replace(temp_path, path)
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)", (digest, len(content))
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, digest, meta, accessed) VALUES (?, ?, ?, ?)",
+                    (key, digest, _json.dumps(meta or {}), _time.time()),
+                )
+            self._remove_orphans(db)
+            if max_size is not None:
+                self._evict(db, max_size)
+        return
+
+    def delete(self, key: str) -> None:
+        """Remove an entry, if it exists."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            with db:
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._remove_orphans(db)
+        return
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            with db:
+                db.execute("DELETE FROM entries")
+            self._remove_orphans(db)
+        return
+
+    def size(self) -> int:
+        """Total size of all stored values in bytes."""
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return 0
+            return db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self, db: _sqlite3.Connection, max_size: int) -> None:
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= max_size:
+            return
+        rows = db.execute(
+            "SELECT key, digest FROM entries ORDER BY accessed DESC"
+        ).fetchall()
+        # Keep the most recently used entries that fit; evict the rest.
+        sizes = dict(db.execute("SELECT digest, size FROM blobs"))
+        kept_digests = set()
+        kept_size = 0
+        evicted = []
+        for key, digest in rows:
+            if digest not in kept_digests:
+                if kept_size + sizes[digest] > max_size:
+                    evicted.append((key,))
+                    continue
+                kept_digests.add(digest)
+                kept_size += sizes[digest]
+        with db:
+            db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._remove_orphans(db)
+        return
+
+    def _remove_orphans(self, db: _sqlite3.Connection) -> None:
+        """Delete stored values that no entry refers to anymore."""
+        orphans = [
+            row[0] for row in db.execute(
+                "SELECT digest FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)"
+            )
+        ]
+        if not orphans:
+            return
+        with db:
+            db.executemany("DELETE FROM blobs WHERE digest = ?", [(digest,) for digest in orphans])
+        for digest in orphans:
+            self._blob_path(digest).unlink(missing_ok=True)
+        return
+
+    def _blob_path(self, digest: str) -> _Path:
+        return self._db_path.parent / self.name / digest[:2] / digest
+
+    def _connect(self) -> _sqlite3.Connection | None:
+        """Get the database connection for the current `settings.cache_dir`, if any."""
+        cache_dir = _settings.cache_dir
+        path = cache_dir / f"{self.name}.sqlite3" if cache_dir else None
+        if path == self._db_path:
+            return self._db
+        if self._db is not None:
+            self._db.close()
+        self._db_path = path
+        self._db = None
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = _sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, digest TEXT NOT NULL, meta TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest)")
+        return self._db
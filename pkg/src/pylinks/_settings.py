@@ -1,6 +1,14 @@
+from pathlib import Path
+
+
 class Settings:
     def __init__(self):
         self._offline_mode = False
+        self._deferred_validation = False
+        self._cache_dir = None
+        self._validation_ttl = 24 * 60 * 60
+        self._validation_negative_ttl = 60 * 60
+        self._data_uri_cache_size = 512 * 2 ** 20
         return
 
     @property
@@ -12,5 +20,55 @@ class Settings:
         self._offline_mode = bool(value)
         return
 
+    @property
+    def deferred_validation(self) -> bool:
+        """Whether site objects defer their online validation until first use; see `pylinks.validation`."""
+        return self._deferred_validation
+
+    @deferred_validation.setter
+    def deferred_validation(self, value: bool):
+        self._deferred_validation = bool(value)
+        return
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Directory to persist caches in; if None (default), caches are only kept in memory."""
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, value: str | Path | None):
+        self._cache_dir = Path(value).expanduser().resolve() if value else None
+        return
+
+    @property
+    def validation_ttl(self) -> float:
+        """Time (in seconds) for which a successful online validation of a URL is reused."""
+        return self._validation_ttl
+
+    @validation_ttl.setter
+    def validation_ttl(self, value: float):
+        self._validation_ttl = float(value)
+        return
+
+    @property
+    def validation_negative_ttl(self) -> float:
+        """Time (in seconds) for which a definitively failed (e.g. 404) online validation of a URL is reused."""
+        return self._validation_negative_ttl
+
+    @validation_negative_ttl.setter
+    def validation_negative_ttl(self, value: float):
+        self._validation_negative_ttl = float(value)
+        return
+
+    @property
+    def data_uri_cache_size(self) -> int:
+        """Maximum total size (in bytes) of data URIs cached in `cache_dir`; see `pylinks.uri.data`."""
+        return self._data_uri_cache_size
+
+    @data_uri_cache_size.setter
+    def data_uri_cache_size(self, value: int):
+        self._data_uri_cache_size = int(value)
+        return
+
 
 settings = Settings()
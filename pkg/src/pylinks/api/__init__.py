@@ -1,8 +1,20 @@
 from typing import Optional
 
-from pylinks.api.doi import DOI
+from pylinks.api.doi import (
+    DOI,
+    abbreviate_journal,
+    add_journal_abbreviations,
+    citeproc_to_bibtex,
+    citeproc_to_ris,
+    normalize as normalize_doi,
+    resolve as resolve_dois,
+)
 from pylinks.api.github import GitHub
-from pylinks.api.orcid import Orcid
+from pylinks.api.orcid import (
+    Orcid,
+    fetch_many as fetch_orcids,
+    fetch_records as fetch_orcid_records,
+)
 from pylinks.api.zenodo import Zenodo
 
 
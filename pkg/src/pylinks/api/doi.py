@@ -1,11 +1,25 @@
 # Standard libraries
 import re
+import json
+import threading
 import unicodedata
 import datetime
-from typing import Optional
+from importlib import resources
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 # Non-standard libraries
 import pylinks as _pylinks
+from pylinks._cache import TTLCache as _TTLCache
+
+
+# Version of cached metadata entries; entries with a different version are refetched.
+_CACHE_VERSION = 1
+# DOI metadata practically never changes, so cached entries do not expire.
+_cache = _TTLCache("doi")
+_journal_abbr_cache = _TTLCache("journal_abbreviation")
+_journal_table: dict | None = None
+_journal_table_lock = threading.Lock()
 
 
 class DOI:
@@ -36,6 +50,7 @@ class DOI:
             raise ValueError(f"Invalid DOI: {doi}")
         self.doi = match.group(1)
         self.url = f"https://doi.org/{self.doi}"  # See also: https://api.crossref.org/works/{doi}
+        self._citeproc: dict | None = None
         return
 
     def text(self, style: Optional[str] = None, locale: Optional[str] = None) -> str:
@@ -84,27 +99,53 @@ class DOI:
     def citeproc_dict(self) -> dict:
         """
         Citation data as a dictionary with Citeproc JSON schema.
+
+        The data is only fetched once, and is cached process-wide
+        (and on disk, when `pylinks.settings.cache_dir` is set); see also `resolve`.
         """
-        return _pylinks.http.request(
-            self.url,
-            headers={"accept": "application/citeproc+json"},
-            encoding="utf-8",
-            response_type="json",
-        )
+        if self._citeproc is None:
+            self._citeproc = _cache_get(self.doi)
+        if self._citeproc is None:
+            self._citeproc = _fetch_citeproc(self.doi)
+        return self._citeproc
 
     @property
-    def curated(self):
-        data = self.citeproc_dict
-        journal = data["container-title"] or None
-        journal_abbr = (
-            (
-                data.get("container-title-short") or _pylinks.http.request(
-                f"https://abbreviso.toolforge.org/abbreviso/a/{journal}",
-                    response_type="str",
-                ).title()
+    def curated(self) -> dict:
+        """Curated publication data, with locally rendered citations; see `curate`."""
+        return self.curate()
+
+    def curate(self, remote_citations: bool = False) -> dict:
+        """
+        Curated publication data.
+
+        Parameters
+        ----------
+        remote_citations : bool, default: False
+            Whether to fetch the BibTeX and RIS citations from doi.org
+            (see `bibtex` and `ris`), instead of rendering them locally
+            from the citeproc data (see `citeproc_to_bibtex` and `citeproc_to_ris`).
+        """
+        # All independent requests are sent concurrently;
+        # only the journal abbreviation lookup has to wait for the citeproc data.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            future_data = executor.submit(lambda: self.citeproc_dict)
+            if remote_citations:
+                future_bibtex = executor.submit(lambda: self.bibtex)
+                future_ris = executor.submit(lambda: self.ris)
+            data = future_data.result()
+            journal = data["container-title"] or None
+            journal_abbr = data.get("container-title-short") if journal else None
+            future_journal_abbr = (
+                executor.submit(abbreviate_journal, journal) if journal and not journal_abbr else None
             )
-            if journal else None
-        )
+            if remote_citations:
+                bibtex = future_bibtex.result()
+                ris = future_ris.result()
+            else:
+                bibtex = citeproc_to_bibtex(data)
+                ris = citeproc_to_ris(data)
+            if future_journal_abbr:
+                journal_abbr = future_journal_abbr.result()
         date = self._get_date(data)
         curated = {
             "doi": self.doi,
@@ -112,8 +153,8 @@ class DOI:
             "type": data["type"],  # e.g. 'journal-article', 'posted-content'
             "subtype": data.get("subtype"),  # e.g. 'preprint' for 'posted-content' type
             "cite": {
-                "BibTex": self.bibtex,
-                "RIS": self.ris,
+                "BibTex": bibtex,
+                "RIS": ris,
             },  # bibtex citation string
             "journal": journal,  # journal name
             "journal_abbr": journal_abbr,  # journal abbreviation
@@ -168,3 +209,422 @@ class DOI:
                         month = date[1]
                         day = date[2]
         return year, month or 1, day or 1
+
+
+def normalize(doi: str) -> str:
+    """
+    Normalize a DOI to its lowercase identifier, e.g. 'https://doi.org/10.1039/D2SC03130B' to '10.1039/d2sc03130b'.
+
+    DOIs are case-insensitive, so normalized DOIs can be used as keys.
+    """
+    return DOI(doi).doi.lower()
+
+
+def resolve(
+    dois: Iterable[str],
+    max_workers: int = 8,
+    batch_size: int = 50,
+    mailto: str | None = None,
+    use_cache: bool = True,
+    return_exceptions: bool = False,
+) -> dict[str, dict | Exception | None]:
+    """
+    Get citation data for many DOIs at once.
+
+    Cached data is used where available. The remaining DOIs are first looked up
+    in batches via the [Crossref REST API](https://api.crossref.org/swagger-ui/index.html),
+    and those not found there (e.g. DOIs registered with DataCite, or DOIs of a failed batch)
+    are resolved concurrently via doi.org content negotiation (see `DOI.citeproc_dict`).
+    All fetched data is cached process-wide, and on disk when `pylinks.settings.cache_dir` is set.
+    DOIs that cannot be resolved do not abort the whole batch, but are reported individually.
+
+    Parameters
+    ----------
+    dois : Iterable[str]
+        DOIs in any format accepted by `DOI`.
+    max_workers : int, default: 8
+        Maximum number of concurrent requests.
+    batch_size : int, default: 50
+        Maximum number of DOIs in each Crossref request.
+    mailto : str, optional
+        Contact email address to send to Crossref, for access to its "polite" pool.
+    use_cache : bool, default: True
+        Whether to use cached data. If False, all DOIs are fetched again (and cached).
+    return_exceptions : bool, default: False
+        Whether to return the raised error for each DOI that could not be resolved,
+        instead of None.
+
+    Returns
+    -------
+    dict[str, dict | Exception | None]
+        Citation data in Citeproc JSON schema, keyed by normalized DOI (see `normalize`),
+        in the order of the input. DOIs that could not be resolved
+        map to None (or the raised error, if `return_exceptions` is True).
+    """
+    def crossref_batch(batch: list[str]) -> list[dict]:
+        try:
+            return _crossref_works(batch, mailto=mailto)
+        except (_pylinks.exception.api.WebAPIError, ValueError, KeyError):
+            # The DOIs are retried individually via doi.org.
+            return []
+
+    def fetch(key: str) -> dict | Exception:
+        try:
+            return _fetch_citeproc(key)
+        except (_pylinks.exception.api.WebAPIError, ValueError) as e:
+            return e
+
+    keys = list(dict.fromkeys(normalize(doi) for doi in dois))
+    results = {key: _cache_get(key) if use_cache else None for key in keys}
+    missing = [key for key, data in results.items() if data is None]
+    # Commas separate values in Crossref filters.
+    batchable = [key for key in missing if "," not in key]
+    batches = [batchable[i:i + batch_size] for i in range(0, len(batchable), batch_size)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for items in executor.map(crossref_batch, batches):
+            for item in items:
+                key = item.get("DOI", "").lower()
+                if key in results:
+                    results[key] = _crossref_to_citeproc(item)
+                    _cache_set(key, results[key])
+        remaining = [key for key, data in results.items() if data is None]
+        for key, data in zip(remaining, executor.map(fetch, remaining)):
+            results[key] = None if isinstance(data, Exception) and not return_exceptions else data
+    return results
+
+
+def _fetch_citeproc(doi: str) -> dict:
+    """Fetch the citeproc data of a normalized DOI from doi.org, and cache it."""
+    data = _pylinks.http.request(
+        f"https://doi.org/{doi}",
+        headers={"accept": "application/citeproc+json"},
+        encoding="utf-8",
+        response_type="json",
+    )
+    _cache_set(doi, data)
+    return data
+
+
+def _crossref_works(dois: list[str], mailto: str | None = None) -> list[dict]:
+    """Get Crossref metadata records of a batch of DOIs."""
+    if not dois:
+        return []
+    params = {"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)}
+    if mailto:
+        params["mailto"] = mailto
+    response = _pylinks.http.request(
+        "https://api.crossref.org/works", params=params, response_type="json"
+    )
+    return response["message"]["items"]
+
+
+def _crossref_to_citeproc(item: dict) -> dict:
+    """Convert a Crossref metadata record to Citeproc JSON, as returned by doi.org."""
+    data = dict(item)
+    for key in ("title", "container-title", "original-title", "short-title", "subtitle"):
+        if isinstance(data.get(key), list):
+            data[key] = data[key][0] if data[key] else ""
+    short_titles = data.pop("short-container-title", None)
+    if short_titles:
+        data["container-title-short"] = short_titles[0]
+    data.setdefault("container-title", "")
+    return data
+
+
+def _cache_get(doi: str) -> dict | None:
+    entry = _cache.get(doi.lower())
+    if entry is None or entry.get("version") != _CACHE_VERSION:
+        return
+    return entry["data"]
+
+
+def _cache_set(doi: str, data: dict) -> None:
+    _cache.set(doi.lower(), {"version": _CACHE_VERSION, "data": data})
+    return
+
+
+def abbreviate_journal(journal: str, online: bool = True) -> str:
+    """
+    Get the ISO 4 abbreviation of a journal title, e.g. 'J. Chem. Inf. Model.'
+    for 'Journal of Chemical Information and Modeling'.
+
+    The abbreviation is looked up in the following order:
+    1. The lookup table of common journals bundled with PyLinks,
+       extended by `add_journal_abbreviations`.
+    2. The cache of previously resolved abbreviations, which is shared process-wide
+       and persisted on disk when `pylinks.settings.cache_dir` is set.
+    3. The [Abbreviso](https://abbreviso.toolforge.org/) web service,
+       whose results are cached, so that it is contacted at most once per journal.
+    4. A rule-based abbreviation using the bundled subset of the
+       [List of Title Word Abbreviations](https://www.issn.org/services/online-services/access-to-the-ltwa/) (LTWA),
+       when `online` is False or the web service fails.
+       These are not cached, so that the web service is tried again on the next call.
+
+    Parameters
+    ----------
+    journal : str
+        Full title of the journal.
+    online : bool, default: True
+        Whether to query the web service for journals not found in the lookup table or the cache.
+    """
+    table = _journal_abbreviations()
+    key = _normalize_journal_title(journal)
+    abbr = table["journals"].get(key) or _journal_abbr_cache.get(key)
+    if abbr:
+        return abbr
+    if online:
+        try:
+            abbr = _pylinks.http.request(
+                f"https://abbreviso.toolforge.org/abbreviso/a/{journal}",
+                response_type="str",
+            ).title()
+        except _pylinks.exception.api.WebAPIError:
+            abbr = None
+        if abbr:
+            _journal_abbr_cache.set(key, abbr)
+            return abbr
+    return _iso4_abbreviate(journal, table)
+
+
+def add_journal_abbreviations(abbreviations: dict[str, str]) -> None:
+    """
+    Add journals to the lookup table used by `abbreviate_journal`.
+
+    Parameters
+    ----------
+    abbreviations : dict[str, str]
+        Abbreviations keyed by full journal titles.
+        Entries override existing ones, including those bundled with PyLinks.
+    """
+    table = _journal_abbreviations()
+    with _journal_table_lock:
+        table["journals"].update(
+            {_normalize_journal_title(title): abbr for title, abbr in abbreviations.items()}
+        )
+    return
+
+
+def _journal_abbreviations() -> dict:
+    """Load the bundled journal abbreviation table."""
+    global _journal_table
+    with _journal_table_lock:
+        if _journal_table is None:
+            data = json.loads(
+                resources.files("pylinks").joinpath("_data/journal/abbreviations.json").read_text("utf-8")
+            )
+            _journal_table = {
+                "journals": {
+                    _normalize_journal_title(title): abbr for title, abbr in data["journals"].items()
+                },
+                "words": data["words"],
+                "omitted": frozenset(data["omitted"]),
+            }
+        return _journal_table
+
+
+def _normalize_journal_title(title: str) -> str:
+    title = unicodedata.normalize("NFKC", title).lower().replace("&", " and ")
+    title = " ".join(re.sub(r"[^\w]+", " ", title).split())
+    return title.removeprefix("the ")
+
+
+def _iso4_abbreviate(journal: str, table: dict) -> str:
+    """Abbreviate a journal title by abbreviating each word according to the LTWA table."""
+    words = unicodedata.normalize("NFKC", journal).split()
+    # Single-word titles are not abbreviated (ISO 4).
+    if len(words) == 1:
+        return words[0]
+    abbreviated = []
+    for word in words:
+        core = word.strip(",.:;()").lower()
+        if core in table["omitted"]:
+            continue
+        abbr = table["words"].get(core)
+        abbreviated.append(word.lower().replace(core, abbr) if abbr else word)
+    return " ".join(abbreviated)
+
+
+_BIBTEX_TYPES = {
+    "article": "article",
+    "article-journal": "article",
+    "journal-article": "article",
+    "book": "book",
+    "monograph": "book",
+    "edited-book": "book",
+    "chapter": "incollection",
+    "book-chapter": "incollection",
+    "paper-conference": "inproceedings",
+    "proceedings-article": "inproceedings",
+    "thesis": "phdthesis",
+    "dissertation": "phdthesis",
+    "report": "techreport",
+}
+_RIS_TYPES = {
+    "article": "JOUR",
+    "article-journal": "JOUR",
+    "journal-article": "JOUR",
+    "book": "BOOK",
+    "monograph": "BOOK",
+    "edited-book": "EDBOOK",
+    "chapter": "CHAP",
+    "book-chapter": "CHAP",
+    "paper-conference": "CPAPER",
+    "proceedings-article": "CPAPER",
+    "thesis": "THES",
+    "dissertation": "THES",
+    "report": "RPRT",
+    "dataset": "DATA",
+    "posted-content": "GEN",
+}
+_BIBTEX_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_BIBTEX_SPECIAL_CHARS = re.compile(r"[&%$#_{}\\]")
+_BIBTEX_ESCAPES = {"\\": r"\textbackslash{}"}
+_MARKUP_TAG = re.compile(r"</?[A-Za-z][\w:.-]*(?:\s[^>]*)?>")
+
+
+def citeproc_to_bibtex(data: dict) -> str:
+    """
+    Render a BibTeX entry from citation data in Citeproc JSON schema,
+    e.g. as returned by `DOI.citeproc_dict`.
+
+    Parameters
+    ----------
+    data : dict
+        Citation data in Citeproc JSON schema.
+
+    Returns
+    -------
+    str
+        The BibTeX entry.
+    """
+    def escape(value) -> str:
+        return _BIBTEX_SPECIAL_CHARS.sub(
+            lambda match: _BIBTEX_ESCAPES.get(match.group(), f"\\{match.group()}"),
+            _MARKUP_TAG.sub("", str(value)),
+        )
+
+    entry_type = _BIBTEX_TYPES.get(data.get("type"), "misc")
+    year, month = (_citeproc_date(data) + [None, None])[:2]
+    def names(people: list[dict]) -> str:
+        # Literal names (e.g. of organizations) are braced to prevent BibTeX from splitting them.
+        return " and ".join(
+            escape(_citeproc_name(person, "{family}, {given}")) if "family" in person
+            else f"{{{escape(_citeproc_name(person, ''))}}}"
+            for person in people
+        )
+
+    container = _first(data.get("container-title"))
+    container_field = {"article": "journal", "incollection": "booktitle", "inproceedings": "booktitle"}.get(
+        entry_type, "howpublished"
+    )
+    pages = data.get("page")
+    fields = [
+        ("title", _first(data.get("title"))),
+        ("author", names(data.get("author", []))),
+        ("editor", names(data.get("editor", []))),
+        (container_field, container if container_field != "howpublished" else None),
+        ("publisher", data.get("publisher") if entry_type not in ("phdthesis", "techreport") else None),
+        ("school", data.get("publisher") if entry_type == "phdthesis" else None),
+        ("institution", data.get("publisher") if entry_type == "techreport" else None),
+        ("volume", data.get("volume")),
+        ("number", data.get("issue")),
+        ("pages", re.sub(r"\s*[-\u2013]\s*", "--", str(pages)) if pages else None),
+        ("year", year),
+        ("issn", _first(data.get("ISSN"))),
+        ("isbn", _first(data.get("ISBN"))),
+        ("doi", data.get("DOI")),
+        ("url", data.get("URL")),
+    ]
+    lines = [f"@{entry_type}{{{_citation_key(data, year)},"]
+    for name, value in fields:
+        if value:
+            # Names are escaped individually, and DOIs and URLs are taken verbatim
+            verbatim = name in ("author", "editor", "doi", "url")
+            lines.append(f"  {name} = {{{value if verbatim else escape(value)}}},")
+        if name == "year" and month:
+            lines.append(f"  month = {_BIBTEX_MONTHS[month - 1]},")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def citeproc_to_ris(data: dict) -> str:
+    """
+    Render a RIS record from citation data in Citeproc JSON schema,
+    e.g. as returned by `DOI.citeproc_dict`.
+
+    Parameters
+    ----------
+    data : dict
+        Citation data in Citeproc JSON schema.
+
+    Returns
+    -------
+    str
+        The RIS record.
+    """
+    date = _citeproc_date(data)
+    pages = re.split(r"\s*[-\u2013]\s*", str(data.get("page") or ""), maxsplit=1)
+    fields = [
+        ("TY", _RIS_TYPES.get(data.get("type"), "GEN")),
+        ("DO", data.get("DOI")),
+        ("UR", data.get("URL")),
+        ("TI", _first(data.get("title"))),
+        *(("AU", _citeproc_name(author, "{family}, {given}")) for author in data.get("author", [])),
+        *(("ED", _citeproc_name(editor, "{family}, {given}")) for editor in data.get("editor", [])),
+        ("T2", _first(data.get("container-title"))),
+        ("J2", _first(data.get("container-title-short"))),
+        ("PY", date[0] if date else None),
+        ("DA", "/".join(f"{part:02}" for part in date) if date else None),
+        ("VL", data.get("volume")),
+        ("IS", data.get("issue")),
+        ("SP", pages[0]),
+        ("EP", pages[1] if len(pages) > 1 else None),
+        ("PB", data.get("publisher")),
+        ("SN", _first(data.get("ISSN")) or _first(data.get("ISBN"))),
+        ("AB", data.get("abstract")),
+    ]
+    lines = []
+    for tag, value in fields:
+        # Each tag must be on a single line; Crossref titles and abstracts often contain line breaks.
+        value = " ".join(_MARKUP_TAG.sub("", str(value)).split()) if value else None
+        if value:
+            lines.append(f"{tag}  - {value}")
+    lines.append("ER  - ")
+    return "\n".join(lines)
+
+
+def _first(value):
+    """Get the first element of a list value (as used by Crossref), or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _citeproc_date(data: dict) -> list[int]:
+    """Get the publication date parts `[year, month, day]` (or a prefix thereof) from citeproc data."""
+    for key in ("issued", "published", "published-print", "published-online", "created"):
+        parts = data.get(key, {}).get("date-parts", [[]])[0]
+        if parts and parts[0]:
+            date = [int(part) for part in parts if part][:3]
+            # Drop out-of-range parts, e.g. the season codes (21-24) that some publishers use as months
+            if len(date) > 1 and not 1 <= date[1] <= 12:
+                return date[:1]
+            if len(date) > 2 and not 1 <= date[2] <= 31:
+                return date[:2]
+            return date
+    return []
+
+
+def _citeproc_name(name: dict, template: str) -> str:
+    if "family" not in name:
+        return name.get("literal") or name.get("name") or ""
+    if not name.get("given"):
+        return name["family"]
+    return template.format(family=name["family"], given=name["given"])
+
+
+def _citation_key(data: dict, year: int | None) -> str:
+    authors = data.get("author") or data.get("editor") or [{}]
+    name = authors[0].get("family") or authors[0].get("literal") or "Unknown"
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return f"{re.sub(r'[^A-Za-z0-9]', '', ascii_name) or 'Unknown'}_{year or 'nd'}"
@@ -3,7 +3,6 @@ from __future__ import annotations as _annotations
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 from pathlib import Path
 import re
-import mimetypes
 
 # Non-standard libraries
 import pylinks as _pylinks
@@ -1300,7 +1299,8 @@ class Repo:
         filepath : str | pathlib.Path
             Path to the file to upload.
         mime_type : str, optional
-            MIME type of the file. If not specified, it will be guessed from the file extension.
+            MIME type of the file. If not specified, it will be guessed from the file extension,
+            or from the file content when the extension is unknown.
         label : str, optional
             Label for the uploaded file to display on GitHub UI instead of the actual filename.
 
@@ -1313,8 +1313,9 @@ class Repo:
         if not filepath.is_file():
             raise FileNotFoundError(f"File not found: {filepath}")
         if not mime_type:
-            mime_type = mimetypes.guess_type(filepath)[0]
-            if not mime_type:
+            try:
+                mime_type = str(_pylinks.media_type.guess_from_filepath(filepath))
+            except _pylinks.exception.media_type.PyLinksMediaTypeGuessError:
                 raise RuntimeError(
                     f"Could not guess MIME type of file '{filepath}'. Please provide it as input argument."
                 )
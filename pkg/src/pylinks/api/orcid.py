@@ -1,9 +1,18 @@
 # Standard libraries
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator
 
 # Non-standard libraries
 import pylinks as _pylinks
+from pylinks._cache import TTLCache as _TTLCache
+from pylinks.api.doi import normalize as _normalize_doi, resolve as _resolve_dois
+
+
+# Profiles are shared between instances (and processes, when `settings.cache_dir` is set);
+# expired entries are revalidated with conditional requests.
+_cache = _TTLCache("orcid")
 
 
 class Orcid:
@@ -15,16 +24,13 @@ class Orcid:
         self.url = f"https://orcid.org/{self.id}"
         self._data: dict = None
         self._dois: list[str] = None
+        self._works: list[dict] = None
         return
 
     @property
     def records(self) -> dict:
         if not self._data:
-            self._data = _pylinks.http.request(
-                url=f"https://pub.orcid.org/v3.0/{self.id}",
-                headers={"Accept": "application/json"},
-                response_type="json",
-            )
+            self._data = fetch_records(self.id)
         return self._data
 
     @property
@@ -40,3 +46,183 @@ class Orcid:
             else:
                 warnings.warn(f"Could not find DOI for work {work}.")
         return self._dois
+
+    def works(self, prefetch_doi: bool = True, max_workers: int = 8) -> list[dict]:
+        """
+        Full records of all works in the profile, with their DOI metadata.
+
+        Full work records are fetched via the bulk works endpoint
+        (up to 100 works per request), with all requests sent concurrently.
+        DOI metadata of the works is then fetched in batches (see `pylinks.api.resolve_dois`).
+
+        Parameters
+        ----------
+        prefetch_doi : bool, default: True
+            Whether to fetch the citation data of each work's DOI.
+        max_workers : int, default: 8
+            Maximum number of concurrent requests.
+
+        Returns
+        -------
+        list[dict]
+            For each work, in the order of the profile, a dictionary with keys:
+            - 'work': The full ORCID work record.
+            - 'doi': DOI of the work, or None if it has none.
+            - 'citeproc': Citation data of the DOI in Citeproc JSON schema,
+              or None if the work has no DOI, `prefetch_doi` is False,
+              or the data could not be fetched (in which case a warning is issued).
+
+        References
+        ----------
+        - [ORCID API: Bulk work](https://info.orcid.org/documentation/api-tutorials/api-tutorial-read-data-on-a-record/#easy-faq-2729)
+        """
+        if self._works is None:
+            put_codes = [
+                work["work-summary"][0]["put-code"]
+                for work in self.records["activities-summary"]["works"]["group"]
+            ]
+            chunks = [put_codes[i:i + 100] for i in range(0, len(put_codes), 100)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(self._bulk_works, chunks))
+            self._works = []
+            for response in responses:
+                for item in response["bulk"]:
+                    if "work" in item:
+                        self._works.append(item["work"])
+                    else:
+                        warnings.warn(f"Could not fetch work: {item.get('error')}")
+        works = []
+        for work in self._works:
+            doi = None
+            for identifier in (work.get("external-ids") or {}).get("external-id", []):
+                if identifier["external-id-type"] == "doi":
+                    doi = identifier["external-id-value"]
+                    break
+            works.append({"work": work, "doi": doi, "citeproc": None})
+        if prefetch_doi:
+            for work in works:
+                if work["doi"]:
+                    try:
+                        work["doi"] = _normalize_doi(work["doi"])
+                    except ValueError:
+                        warnings.warn(f"Invalid DOI {work['doi']} for work {work['work'].get('put-code')}.")
+                        work["doi"] = None
+            try:
+                citeproc = _resolve_dois(
+                    [work["doi"] for work in works if work["doi"]],
+                    max_workers=max_workers,
+                    return_exceptions=True,
+                )
+            except Exception as e:
+                warnings.warn(f"Could not fetch DOI metadata of works: {e!r}")
+                citeproc = {}
+            for work in works:
+                if not work["doi"]:
+                    continue
+                data = citeproc.get(work["doi"])
+                if isinstance(data, dict):
+                    work["citeproc"] = data
+                elif citeproc:
+                    warnings.warn(f"Could not fetch DOI metadata of {work['doi']} for work {work['work'].get('put-code')}.")
+        return works
+
+    def _bulk_works(self, put_codes: list[int]) -> dict:
+        return _pylinks.http.request(
+            url=f"https://pub.orcid.org/v3.0/{self.id}/works/{','.join(str(code) for code in put_codes)}",
+            headers={"Accept": "application/json"},
+            response_type="json",
+        )
+
+
+def fetch_records(orcid_id: str, ttl: float = 60 * 60) -> dict:
+    """
+    Get the full record of an ORCID profile, using the shared profile cache.
+
+    Cached records are returned as long as they are younger than `ttl`.
+    Older records are revalidated with a conditional request
+    (using the 'Last-Modified' and 'ETag' headers of the previous response),
+    so that unchanged records are not downloaded again.
+
+    Parameters
+    ----------
+    orcid_id : str
+        ORCID iD, either as a URL or the identifier alone.
+    ttl : float, default: 3600
+        Time (in seconds) for which a fetched record is used without revalidation.
+    """
+    orcid_id = Orcid(orcid_id).id
+    entry = _cache.get_entry(orcid_id)
+    # Freshness is decided by the caller's `ttl`, not the one the entry was stored with.
+    if entry is not None and entry.age < ttl:
+        return entry.value["data"]
+    headers = {"Accept": "application/json"}
+    if entry is not None:
+        if entry.value.get("last_modified"):
+            headers["If-Modified-Since"] = entry.value["last_modified"]
+        if entry.value.get("etag"):
+            headers["If-None-Match"] = entry.value["etag"]
+    response = _pylinks.http.request(
+        url=f"https://pub.orcid.org/v3.0/{orcid_id}",
+        headers=headers,
+        response_type=None,
+    )
+    if response.status_code == 304 and entry is not None:
+        _cache.set(orcid_id, entry.value, ttl=ttl)
+        return entry.value["data"]
+    value = {
+        "data": response.json(),
+        "last_modified": response.headers.get("Last-Modified"),
+        "etag": response.headers.get("ETag"),
+    }
+    _cache.set(orcid_id, value, ttl=ttl)
+    return value["data"]
+
+
+def fetch_many(
+    orcid_ids: Iterable[str],
+    max_workers: int = 8,
+    ttl: float = 60 * 60,
+    return_exceptions: bool = False,
+) -> Iterator[tuple[str, Orcid | Exception]]:
+    """
+    Load many ORCID profiles concurrently, yielding each as soon as it is loaded.
+
+    Records are fetched with `fetch_records`, and thus use (and fill) the shared profile cache.
+
+    Parameters
+    ----------
+    orcid_ids : Iterable[str]
+        ORCID iDs, either as URLs or identifiers alone.
+    max_workers : int, default: 8
+        Maximum number of concurrent requests.
+    ttl : float, default: 3600
+        Time (in seconds) for which a fetched record is used without revalidation.
+    return_exceptions : bool, default: False
+        Whether to yield errors instead of raising them,
+        so that a failing profile does not abort the whole batch.
+
+    Yields
+    ------
+    tuple[str, Orcid | Exception]
+        The input ORCID iD and the corresponding `Orcid` instance with loaded records
+        (or the raised exception, if `return_exceptions` is True), in order of completion.
+    """
+    def load(orcid_id: str) -> Orcid:
+        orcid = Orcid(orcid_id)
+        orcid._data = fetch_records(orcid.id, ttl=ttl)
+        return orcid
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(load, orcid_id): orcid_id for orcid_id in dict.fromkeys(orcid_ids)}
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    yield futures[future], e
+        finally:
+            for future in futures:
+                future.cancel()
+    return
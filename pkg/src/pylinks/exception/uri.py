@@ -18,3 +18,21 @@ class PyLinksDataURIParseError(_PyLinksError):
         self.problem = problem
         self.data_uri = data_uri
         return
+
+
+class PyLinksDataURIDecodeError(_PyLinksError):
+    """Error decoding the data of a data URI."""
+    def __init__(self, problem: str, data_uri: str):
+        preview = data_uri if len(data_uri) <= 100 else f"{data_uri[:100]}…"
+        super().__init__(
+            title="Data URI Decode Error",
+            intro=_mdit.inline_container(
+                "Failed to decode data URI ",
+                _mdit.element.code_span(preview),
+                ". ",
+                problem,
+            )
+        )
+        self.problem = problem
+        self.data_uri = data_uri
+        return
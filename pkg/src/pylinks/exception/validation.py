@@ -0,0 +1,47 @@
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import mdit as _mdit
+import requests as _requests
+
+from pylinks.exception import PyLinksError as _PyLinksError
+
+if _TYPE_CHECKING:
+    from pylinks.validation import LinkStatus
+
+
+class PyLinksLinkValidationError(_PyLinksError, _requests.HTTPError):
+    """Error validating the existence of one or several online resources.
+
+    This is also a `requests.HTTPError`, as raised by site objects before they used `pylinks.validation`,
+    so that existing error handling keeps working.
+    """
+    def __init__(self, failed: list[LinkStatus]):
+        if len(failed) == 1:
+            status = failed[0]
+            intro = _mdit.inline_container(
+                "Failed to validate URL ",
+                _mdit.element.code_span(status.url),
+                f": {_describe(status)}",
+            )
+            details = None
+        else:
+            intro = f"Failed to validate {len(failed)} URLs."
+            details = _mdit.element.code_block(
+                "\n".join(f"{status.url}: {_describe(status)}" for status in failed),
+                caption="Failed URLs",
+            )
+        super().__init__(
+            title="Link Validation Error",
+            intro=intro,
+            details=details,
+        )
+        self.failed = failed
+        return
+
+
+def _describe(status: LinkStatus) -> str:
+    if status.error:
+        return status.error
+    return f"HTTP {status.status_code} response to {status.method} request"
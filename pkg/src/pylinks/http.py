@@ -103,6 +103,7 @@ def request(
     retry_config: Optional[HTTPRequestRetryConfig] = HTTPRequestRetryConfig(),
     ignored_status_codes: Optional[Sequence[int]] = None,
     json_kwargs: dict = None,
+    session: Optional[requests.Session] = None,
 ) -> Union[requests.Response, str, dict, list, bool, int, bytes]:
     """
     Send an HTTP request and get the response in specified type.
@@ -137,6 +138,9 @@ def request(
     encoding
     json_kwargs : dict
         Optional arguments for `json.loads`, when `response_type` is set to `"json"`.
+    session : requests.Session, optional
+        Session to send the request with, so that its connections are pooled
+        across many requests. If not provided, a new connection is opened for the request.
 
     Returns
     -------
@@ -159,7 +163,7 @@ def request(
     def get_response_value():
         def get_response():
             try:
-                response = requests.request(
+                response = (session or requests).request(
                     method=verb,
                     url=str(url),
                     params=params,
@@ -266,6 +270,7 @@ def graphql_query(
     retry_config: Optional[HTTPRequestRetryConfig] = HTTPRequestRetryConfig(),
     ignored_status_codes: Optional[Sequence[int]] = None,
     json_kwargs: dict = None,
+    session: Optional[requests.Session] = None,
 ) -> Union[requests.Response, str, dict, list, bool, int, bytes]:
     args = locals()
     args["verb"] = "POST"
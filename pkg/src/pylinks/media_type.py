@@ -8,15 +8,40 @@ References
 - [Database of mime types](https://github.com/patrickmccallum/mimetype-io/blob/master/src/mimeData.json)
 - [JSON list of file extensions with their mime types](https://github.com/micnic/mime.json)
 - [Python mimetypes](https://docs.python.org/3/library/mimetypes.html)
+- [List of file signatures](https://en.wikipedia.org/wiki/List_of_file_signatures)
+- [MIME Sniffing Standard](https://mimesniff.spec.whatwg.org/)
 """
 
-import mimetypes as _mimetypes
 import dataclasses as _dataclasses
+import functools as _functools
+import json as _json
+import os as _os
 import re as _re
+from concurrent import futures as _futures
+from importlib import resources as _resources
+from pathlib import Path as _Path
+from types import MappingProxyType as _MappingProxyType
+from typing import BinaryIO as _BinaryIO, Iterable as _Iterable, Iterator as _Iterator
+from urllib.parse import urlsplit as _urlsplit
 
 from pylinks import exception as _exception
 
 
+_PATTERN = _re.compile(
+    r"""
+        ^
+        (?P<type>[\w\-]+)
+        /
+        (?:(?P<tree>[\w\-]+)\.)?
+        (?P<subtype>[\w\-.]+)
+        (?P<suffixes>(\+[\w\-.]+)*)?
+        (?:\s*;\s*(?P<parameters>.*))?
+        $
+    """,
+    _re.VERBOSE
+)
+
+
 @_dataclasses.dataclass
 class MediaType:
     """A [Media Type](https://www.iana.org/assignments/media-types/media-types.xhtml) (aka MIME type).
@@ -50,50 +75,121 @@ class MediaType:
     parameters: dict[str, str | None] = _dataclasses.field(default_factory=dict)
 
     def __str__(self) -> str:
-        suffixes = "".join(f"+{suffix}" for suffix in self.suffixes)
-        if self.parameters:
-            joined = "; ".join(f"{k}={v}" if v else k for k, v in self.parameters.items())
-            params = f"; {joined}"
-        else:
-            params = ""
-        full_subtype = f"{self.tree}.{self.subtype}" if self.tree else self.subtype
-        return f"{self.type}/{full_subtype}{suffixes}{params}"
+        return _format(self.type, self.subtype, self.tree, self.suffixes, self.parameters.items())
+
+    def freeze(self) -> "FrozenMediaType":
+        """Get an immutable, hashable copy of the media type."""
+        return FrozenMediaType(
+            type=self.type,
+            subtype=self.subtype,
+            tree=self.tree,
+            suffixes=tuple(self.suffixes),
+            parameters=tuple(self.parameters.items()),
+        )
+
+
+@_dataclasses.dataclass(frozen=True, slots=True)
+class FrozenMediaType:
+    """An immutable [Media Type](https://www.iana.org/assignments/media-types/media-types.xhtml).
+
+    This is the immutable, hashable variant of `MediaType`,
+    which can be safely shared, e.g. as returned by `parse_cached`.
+
+    Attributes
+    ----------
+    type : str
+        Type of the media.
+    subtype : str
+        Subtype of the media (without the tree prefix).
+    tree : str, default: ""
+        Tree prefix of the media type.
+    suffixes : tuple[str, ...], default: ()
+        Type suffixes.
+    parameters : tuple[tuple[str, str | None], ...], default: ()
+        Additional parameters as key-value pairs.
+    """
+    type: str
+    subtype: str
+    tree: str = ""
+    suffixes: tuple[str, ...] = ()
+    parameters: tuple[tuple[str, str | None], ...] = ()
+
+    def __str__(self) -> str:
+        return _format(self.type, self.subtype, self.tree, self.suffixes, self.parameters)
+
+    def thaw(self) -> MediaType:
+        """Get a mutable copy of the media type."""
+        return MediaType(
+            type=self.type,
+            subtype=self.subtype,
+            tree=self.tree,
+            suffixes=list(self.suffixes),
+            parameters=dict(self.parameters),
+        )
 
 
 def parse(media_type: str) -> MediaType:
-    regex = _re.compile(
-        r"""
-            ^
-            (?P<type>[\w\-]+)
-            /
-            (?:(?P<tree>[\w\-]+)\.)?
-            (?P<subtype>[\w\-.]+)
-            (?P<suffixes>(\+[\w\-.]+)*)?
-            (?:\s*;\s*(?P<parameters>.*))?
-            $
-        """,
-        _re.VERBOSE
-    )
-    match = regex.match(media_type)
+    """Parse a media type string, e.g. 'text/plain; charset=UTF-8'.
+
+    Parameters
+    ----------
+    media_type : str
+        The media type to parse.
+
+    Returns
+    -------
+    MediaType
+        A new (mutable) media type instance.
+        For repeated parsing of the same strings, `parse_cached` is faster.
+    """
+    return parse_cached(media_type).thaw()
+
+
+@_functools.lru_cache(maxsize=1024)
+def parse_cached(media_type: str) -> FrozenMediaType:
+    """Parse a media type string, and memoize the result.
+
+    Parsed media types are cached and shared between calls,
+    i.e. parsing the same string again only costs a dictionary lookup,
+    and returns the same immutable instance.
+
+    Parameters
+    ----------
+    media_type : str
+        The media type to parse.
+
+    Returns
+    -------
+    FrozenMediaType
+        The shared, immutable media type instance.
+    """
+    match = _PATTERN.match(media_type)
     if not match:
         raise _exception.media_type.PyLinksMediaTypeParseError(
-            f"The input does not match the regex pattern '{regex.pattern}'.",
+            f"The input does not match the regex pattern '{_PATTERN.pattern}'.",
             media_type
         )
     mime = match.groupdict()
-    mime["suffixes"] = [suffix for suffix in mime.get("suffixes", "").split("+") if suffix]
+    mime["suffixes"] = tuple(suffix for suffix in (mime["suffixes"] or "").split("+") if suffix)
     params = {}
     if mime["parameters"]:
         for param in mime["parameters"].split(";"):
             key, *value = param.split("=", 1)
             params[key.strip()] = value[0].strip() if value else None
-    mime["parameters"] = params
-    return MediaType(**mime)
+    mime["parameters"] = tuple(params.items())
+    mime["tree"] = mime["tree"] or ""
+    return FrozenMediaType(**mime)
 
 
 def guess_from_uri(uri: str) -> MediaType:
     """Guess the media type of a given URI (e.g. URL or filepath).
 
+    The guess is a lookup of the URI's file extension in a bundled,
+    static extension table (see `extension_table`),
+    so the result is the same on every machine.
+    Multi-part extensions like `.tar.gz` take precedence over single ones.
+    For `data:` URIs, the declared media type is returned.
+
     Parameters
     ----------
     uri : str
@@ -103,13 +199,392 @@ def guess_from_uri(uri: str) -> MediaType:
     -------
     MediaType
         The guessed media type.
+
+    Raises
+    ------
+    pylinks.exception.media_type.PyLinksMediaTypeGuessError
+        If the extension is not known.
     """
     uri = str(uri)
-    mimetype = _mimetypes.guess_type(uri)[0]
+    mimetype = _guess_from_uri(uri)
     if mimetype is None:
         raise _exception.media_type.PyLinksMediaTypeGuessError(uri)
     return parse(mimetype)
 
-# TODO: Add function to guess from file
-# Refs:
-# - https://pypi.org/project/python-magic/
\ No newline at end of file
+
+@_functools.cache
+def extension_table() -> _MappingProxyType[str, str]:
+    """Get the bundled mapping of file extensions to media types.
+
+    Extensions include the leading dot, e.g. '.png' or '.tar.gz'.
+    The table is loaded once from the package data, and returned as a read-only mapping.
+    It is generated from the default tables of Python's `mimetypes` module
+    (without any system mime.types files), extended with common types from
+    [mime-db](https://github.com/jshttp/mime-db) and compound archive extensions.
+    """
+    data = _resources.files("pylinks").joinpath("_data/media_type/extensions.json").read_text("utf-8")
+    return _MappingProxyType(_json.loads(data))
+
+
+def _guess_from_uri(uri: str) -> str | None:
+    if len(uri) > 2 and uri[1] != ":":  # Windows drive letters are not URL schemes
+        components = _urlsplit(uri)
+        if components.scheme == "data":
+            media_type = components.path.split(",", 1)[0].split(";", 1)[0]
+            return media_type or "text/plain"
+        if components.scheme:
+            uri = components.path
+    filename = uri.replace("\\", "/").rsplit("/", 1)[-1]
+    table = extension_table()
+    start = filename.find(".", 1)
+    while start != -1:
+        extension = filename[start:]
+        mimetype = table.get(extension) or table.get(extension.lower())
+        if mimetype:
+            return mimetype
+        start = filename.find(".", start + 1)
+    return None
+
+
+def _format(type: str, subtype: str, tree: str, suffixes, parameters) -> str:
+    suffixes = "".join(f"+{suffix}" for suffix in suffixes)
+    joined = "; ".join(f"{k}={v}" if v else k for k, v in parameters)
+    params = f"; {joined}" if joined else ""
+    full_subtype = f"{tree}.{subtype}" if tree else subtype
+    return f"{type}/{full_subtype}{suffixes}{params}"
+
+
+_SNIFF_SIZE = 4096
+"""Default number of leading bytes read for content sniffing."""
+
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+    (b"\x00\x00\x01\x00", "image/vnd.microsoft.icon"),
+    (b"\xff\x0a", "image/jxl"),
+    (b"\x00\x00\x00\x0cJXL \x0d\x0a\x87\x0a", "image/jxl"),
+    (b"%PDF-", "application/pdf"),
+    (b"%!PS", "application/postscript"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"PK\x05\x06", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+    (b"BZh", "application/x-bzip2"),
+    (b"\xfd7zXZ\x00", "application/x-xz"),
+    (b"\x28\xb5\x2f\xfd", "application/zstd"),
+    (b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (b"Rar!\x1a\x07", "application/vnd.rar"),
+    (b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (b"\x00asm", "application/wasm"),
+    (b"\x7fELF", "application/x-elf"),
+    (b"MZ", "application/vnd.microsoft.portable-executable"),
+    (b"OggS", "audio/ogg"),
+    (b"fLaC", "audio/flac"),
+    (b"ID3", "audio/mpeg"),
+    (b"MThd", "audio/midi"),
+    (b"\x1a\x45\xdf\xa3", "video/x-matroska"),
+    (b"wOFF", "font/woff"),
+    (b"wOF2", "font/woff2"),
+    (b"OTTO", "font/otf"),
+    (b"\x00\x01\x00\x00\x00", "font/ttf"),
+    (b"RIFF", "RIFF"),
+)
+"""Magic numbers at the start of files, and their media types.
+
+'RIFF' is a container, which is resolved further by `_sniff_riff`.
+"""
+
+_BMP_DIB_HEADER_SIZES = frozenset((12, 16, 40, 52, 56, 64, 108, 124))
+"""Sizes of the known variants of the DIB header following the BMP file header."""
+
+_RIFF_FORMATS = {
+    b"WEBP": "image/webp",
+    b"WAVE": "audio/wav",
+    b"AVI ": "video/x-msvideo",
+}
+
+_FTYP_BRANDS = {
+    b"avif": "image/avif",
+    b"avis": "image/avif",
+    b"heic": "image/heic",
+    b"heix": "image/heic",
+    b"mif1": "image/heif",
+    b"qt  ": "video/quicktime",
+    b"M4A ": "audio/mp4",
+    b"M4B ": "audio/mp4",
+}
+
+_MARKUP_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"<!doctype html", "text/html"),
+    (b"<html", "text/html"),
+    (b"<svg", "image/svg+xml"),
+    (b"<?xml", "application/xml"),
+)
+"""Case-insensitive signatures of markup documents, after leading whitespace."""
+
+_TEXT_CONTROL_CHARS = bytes(set(range(32)) - {8, 9, 10, 12, 13, 27}) + b"\x7f"
+
+
+def _build_signature_trie(signatures: tuple[tuple[bytes, str], ...]) -> dict:
+    trie = {}
+    for signature, media_type in signatures:
+        node = trie
+        for byte in signature:
+            node = node.setdefault(byte, {})
+        node[None] = media_type
+    return trie
+
+
+_SIGNATURE_TRIE = _build_signature_trie(_SIGNATURES)
+_MARKUP_SIGNATURE_TRIE = _build_signature_trie(_MARKUP_SIGNATURES)
+
+
+def guess_from_content(
+    source: bytes | bytearray | memoryview | str | _Path | _BinaryIO,
+    max_bytes: int = _SNIFF_SIZE,
+) -> MediaType:
+    """Guess the media type of some data from its content.
+
+    Only the first `max_bytes` bytes of the data are inspected,
+    by matching them against the magic numbers of common file formats.
+    Data without a known signature is recognized as HTML, SVG, XML, or plain text
+    when it looks like (UTF-8) text.
+
+    Parameters
+    ----------
+    source : bytes | bytearray | memoryview | str | pathlib.Path | typing.BinaryIO
+        The data to guess the media type of, either as a bytes-like object,
+        a path to a file, or a binary stream.
+        Streams are read from their current position and, when seekable, rewound afterwards.
+    max_bytes : int, default: 4096
+        Maximum number of bytes to read from the start of the data.
+
+    Returns
+    -------
+    MediaType
+        The guessed media type.
+
+    Raises
+    ------
+    pylinks.exception.media_type.PyLinksMediaTypeGuessError
+        If the media type cannot be determined.
+    """
+    if isinstance(source, (str, _Path)):
+        with open(source, "rb") as file:
+            head = file.read(max_bytes)
+        name = str(source)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(memoryview(source)[:max_bytes])
+        name = f"<{type(source).__name__}>"
+    else:
+        if source.seekable():
+            position = source.tell()
+            head = source.read(max_bytes)
+            source.seek(position)
+        else:
+            head = source.read(max_bytes)
+        name = str(getattr(source, "name", "<stream>"))
+    mimetype = _sniff(head)
+    if mimetype is None:
+        raise _exception.media_type.PyLinksMediaTypeGuessError(name)
+    return parse(mimetype)
+
+
+def guess_from_filepath(filepath: str | _Path, sniff: bool = True) -> MediaType:
+    """Guess the media type of a file, from its extension or its content.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file.
+    sniff : bool, default: True
+        Whether to guess from the file content (see `guess_from_content`)
+        when the extension is unknown.
+
+    Returns
+    -------
+    MediaType
+        The guessed media type.
+
+    Raises
+    ------
+    pylinks.exception.media_type.PyLinksMediaTypeGuessError
+        If the media type cannot be determined.
+    """
+    filepath = str(filepath)
+    mimetype = _guess_from_uri(filepath)
+    if mimetype is not None:
+        return parse(mimetype)
+    if not sniff:
+        raise _exception.media_type.PyLinksMediaTypeGuessError(filepath)
+    return guess_from_content(filepath)
+
+
+def guess_many(
+    paths: str | _Path | _Iterable[str | _Path],
+    recursive: bool = True,
+    sniff: bool = True,
+    max_workers: int = 8,
+) -> _Iterator[tuple[_Path, MediaType | None]]:
+    """Guess the media types of many files.
+
+    Each file is first looked up in the extension table (see `guess_from_uri`),
+    and only files with unknown extensions are sniffed (see `guess_from_content`),
+    using a thread pool for the file reads.
+    Unlike the single-file functions, files whose media type cannot be determined
+    (including files that cannot be read) do not raise an error, but are yielded with `None`.
+    Directories that cannot be listed are skipped.
+
+    Parameters
+    ----------
+    paths : str | pathlib.Path | Iterable[str | pathlib.Path]
+        Path to a directory, or an iterable of paths to files and/or directories.
+        Directories are walked to find all files in them.
+    recursive : bool, default: True
+        Whether to also walk subdirectories of directories.
+    sniff : bool, default: True
+        Whether to guess from file contents when the extension is unknown.
+    max_workers : int, default: 8
+        Maximum number of files read concurrently.
+
+    Yields
+    ------
+    tuple[pathlib.Path, MediaType | None]
+        Path to each file and its guessed media type.
+        Files with known extensions are yielded in input order as they are encountered,
+        while sniffed files are yielded in order of completion.
+    """
+    def guess_content(path: str) -> MediaType | None:
+        try:
+            return guess_from_content(path)
+        except (_exception.media_type.PyLinksMediaTypeGuessError, OSError):
+            # Unreadable files (e.g. without permission, or removed during the walk) are not guessed.
+            return None
+
+    if isinstance(paths, (str, _Path)):
+        paths = [paths]
+    max_pending = max_workers * 4
+    with _futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        try:
+            for path in _iter_files(paths, recursive=recursive):
+                mimetype = _guess_from_uri(path)
+                if mimetype is not None or not sniff:
+                    yield _Path(path), parse(mimetype) if mimetype else None
+                    continue
+                pending[executor.submit(guess_content, path)] = path
+                if len(pending) >= max_pending:
+                    done, _ = _futures.wait(pending, return_when=_futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield _Path(pending.pop(future)), future.result()
+            for future in _futures.as_completed(pending):
+                yield _Path(pending[future]), future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+    return
+
+
+def _iter_files(paths: _Iterable[str | _Path], recursive: bool) -> _Iterator[str]:
+    for path in paths:
+        path = _os.fspath(path)
+        if not _os.path.isdir(path):
+            yield path
+            continue
+        directories = [path]
+        while directories:
+            try:
+                entries = _os.scandir(directories.pop())
+            except OSError:
+                # Unreadable (or meanwhile removed) directories are skipped.
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                directories.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+    return
+
+
+def _sniff(head: bytes) -> str | None:
+    if head[4:8] == b"ftyp":
+        return _FTYP_BRANDS.get(head[8:12], "video/mp4")
+    mimetype = _match_signature(_SIGNATURE_TRIE, head)
+    if mimetype == "RIFF":
+        return _RIFF_FORMATS.get(head[8:12])
+    check = _WEAK_SIGNATURE_CHECKS.get(mimetype)
+    if check is not None and not check(head):
+        # Short signatures also start ordinary text (e.g. 'BMW', 'MZ', 'ID3'),
+        # so unless the header structure confirms the format, text takes precedence.
+        return _sniff_text(head) or mimetype
+    if mimetype:
+        return mimetype
+    if head[257:262] == b"ustar":
+        return "application/x-tar"
+    return _sniff_text(head)
+
+
+def _sniff_text(head: bytes) -> str | None:
+    if not head or head.translate(None, _TEXT_CONTROL_CHARS) != head:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Only allow a multibyte character truncated at the end of the head
+        if e.start < len(head) - 3 or e.reason != "unexpected end of data":
+            return None
+    markup = head.removeprefix(b"\xef\xbb\xbf").lstrip()[:16].lower()
+    mimetype = _match_signature(_MARKUP_SIGNATURE_TRIE, markup)
+    if mimetype == "application/xml" and b"<svg" in head.lower():
+        return "image/svg+xml"
+    return mimetype or "text/plain"
+
+
+def _is_bmp(head: bytes) -> bool:
+    return int.from_bytes(head[14:18], "little") in _BMP_DIB_HEADER_SIZES
+
+
+def _is_portable_executable(head: bytes) -> bool:
+    if len(head) < 64:
+        return False
+    pe_offset = int.from_bytes(head[60:64], "little")
+    return head[pe_offset:pe_offset + 4] == b"PE\x00\x00"
+
+
+def _is_id3(head: bytes) -> bool:
+    # Major version, revision (never 0xFF), flags (unused bits are zero), and syncsafe size
+    return (
+        len(head) >= 10
+        and head[3] in (2, 3, 4)
+        and head[4] != 0xFF
+        and head[5] & 0x0F == 0
+        and all(byte < 0x80 for byte in head[6:10])
+    )
+
+
+_WEAK_SIGNATURE_CHECKS = {
+    "image/bmp": _is_bmp,
+    "application/vnd.microsoft.portable-executable": _is_portable_executable,
+    "audio/mpeg": _is_id3,
+}
+"""Structure checks for media types whose signatures are too short to be conclusive."""
+
+
+def _match_signature(trie: dict, data: bytes) -> str | None:
+    match = None
+    node = trie
+    for byte in data:
+        node = node.get(byte)
+        if node is None:
+            break
+        match = node.get(None, match)
+    return match
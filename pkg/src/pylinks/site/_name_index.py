@@ -0,0 +1,225 @@
+"""Local, compact indices of package names for offline validation of site objects."""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+import bisect as _bisect
+import gzip as _gzip
+import json as _json
+import threading as _threading
+import time as _time
+from array import array as _array
+
+import pylinks as _pylinks
+from pylinks.exception.validation import PyLinksLinkValidationError as _PyLinksLinkValidationError
+
+if _TYPE_CHECKING:
+    from typing import Callable, Iterable
+    from pathlib import Path
+
+
+class NameIndex:
+    """A sorted index of normalized package names.
+
+    All names are stored in a single newline-delimited string with an array of offsets,
+    and membership is tested by binary search, which takes microseconds
+    and a fraction of the memory of a set of strings.
+
+    The index is downloaded from its source on `refresh`,
+    using conditional requests so that unchanged sources are not downloaded again,
+    and is persisted in `settings.cache_dir` (when set), from where it is read by `load`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source_url: str,
+        extract: Callable[[dict], Iterable[str]],
+        normalize: Callable[[str], str],
+        headers: dict[str, str] | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        name : str
+            Name of the index, used as filename in the cache directory.
+        source_url : str
+            URL of the JSON document listing all package names.
+        extract : Callable[[dict], Iterable[str]]
+            Function extracting the package names from the JSON document.
+        normalize : Callable[[str], str]
+            Function normalizing package names for comparison.
+        headers : dict[str, str], optional
+            Headers to send with the request to the source.
+        """
+        self.name = name
+        self.source_url = source_url
+        self.strict = False
+        self._extract = extract
+        self._normalize = normalize
+        self._headers = headers or {}
+        self._blob = ""
+        self._offsets = _array("L", [0])
+        self._extra: set[str] = set()
+        self._meta: dict = {}
+        self._loaded = False
+        self._lock = _threading.Lock()
+        return
+
+    def __contains__(self, name: str) -> bool:
+        name = self._normalize(name)
+        return name in self._extra or self._in_blob(name)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1 + len(self._extra)
+
+    def __repr__(self):
+        return f"NameIndex(name={self.name}, size={len(self)}, updated={self.updated})"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been loaded or downloaded, and is thus used for validation."""
+        return self._loaded
+
+    @property
+    def updated(self) -> float | None:
+        """Time (as a Unix timestamp) of the last download of the index."""
+        return self._meta.get("updated")
+
+    def load(self, refresh: bool | float = False) -> NameIndex:
+        """
+        Load the index from the cache directory, downloading it if necessary.
+
+        Parameters
+        ----------
+        refresh : bool | float, default: False
+            Whether to refresh the index from its source after loading.
+            If a number is given, the index is only refreshed if it is older than that many seconds.
+        """
+        path = self._path
+        if path is not None and path.is_file():
+            with _gzip.open(path, "rt", encoding="utf-8") as file:
+                names = file.read().splitlines()
+            meta_path = path.with_suffix(".json")
+            meta = _json.loads(meta_path.read_text()) if meta_path.is_file() else {}
+            self._set(names, meta)
+        if not self._loaded:
+            refresh = True
+        elif refresh is not True and refresh is not False:
+            refresh = _time.time() - (self.updated or 0) > refresh
+        if refresh:
+            self.refresh()
+        return self
+
+    def refresh(self) -> bool:
+        """
+        Download the index from its source, if it has changed since the last download.
+
+        Returns
+        -------
+        bool
+            Whether the index was updated.
+        """
+        headers = dict(self._headers)
+        if self._loaded and self._meta.get("etag"):
+            headers["If-None-Match"] = self._meta["etag"]
+        if self._loaded and self._meta.get("last_modified"):
+            headers["If-Modified-Since"] = self._meta["last_modified"]
+        response = _pylinks.http.request(self.source_url, headers=headers, response_type=None)
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "updated": _time.time(),
+        }
+        if response.status_code == 304:
+            self._meta["updated"] = meta["updated"]
+            self._save(names=None)
+            return False
+        names = sorted({self._normalize(name) for name in self._extract(response.json())})
+        self._set(names, meta)
+        self._save(names=names)
+        return True
+
+    def add(self, name: str) -> None:
+        """Add a package name to the index, e.g. after it has been validated online."""
+        if name not in self:
+            with self._lock:
+                self._extra.add(self._normalize(name))
+        return
+
+    def validate(self, name: str) -> bool | None:
+        """
+        Check whether a package exists, according to the index.
+
+        Returns
+        -------
+        bool | None
+            True if the name is in the index, False if it is not and the index is `strict`,
+            and None if the index is not loaded or not strict, i.e. the name must be validated online.
+        """
+        if not self._loaded:
+            return
+        if name in self:
+            return True
+        return False if self.strict else None
+
+    @property
+    def _path(self) -> Path | None:
+        cache_dir = _pylinks.settings.cache_dir
+        return cache_dir / "index" / f"{self.name}.txt.gz" if cache_dir else None
+
+    def _in_blob(self, name: str) -> bool:
+        count = len(self._offsets) - 1
+        index = _bisect.bisect_left(range(count), name, key=self._entry)
+        return index < count and self._entry(index) == name
+
+    def _entry(self, index: int) -> str:
+        return self._blob[self._offsets[index]:self._offsets[index + 1] - 1]
+
+    def _set(self, names: list[str], meta: dict) -> None:
+        offsets = _array("L", [0])
+        position = 0
+        for name in names:
+            position += len(name) + 1
+            offsets.append(position)
+        blob = "".join(f"{name}\n" for name in names)
+        with self._lock:
+            self._blob, self._offsets, self._meta = blob, offsets, meta
+            self._extra = {name for name in self._extra if not self._in_blob(name)}
+            self._loaded = True
+        return
+
+    def _save(self, names: list[str] | None) -> None:
+        path = self._path
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if names is not None:
+            with _gzip.open(path, "wt", encoding="utf-8") as file:
+                file.writelines(f"{name}\n" for name in names)
+        path.with_suffix(".json").write_text(_json.dumps(self._meta))
+        return
+
+
+def validate_with_index(index: NameIndex, name: str, url: str | _pylinks.url.URL) -> bool:
+    """
+    Validate a package using a local index.
+
+    Returns
+    -------
+    bool
+        Whether the package was validated, i.e. False if it must be validated online.
+
+    Raises
+    ------
+    pylinks.exception.validation.PyLinksLinkValidationError
+        If the package is not in a strict index.
+    """
+    exists = index.validate(name)
+    if exists is None:
+        return False
+    if not exists:
+        raise _PyLinksLinkValidationError(
+            [_pylinks.validation.LinkStatus(url=str(url), ok=False, error="Not found in local package index.")]
+        )
+    return True
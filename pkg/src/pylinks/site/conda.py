@@ -6,12 +6,14 @@ import re
 from typing import Optional
 
 # Non-standard libraries
-import requests
 import pylinks as _pylinks
+from pylinks.site._name_index import NameIndex as _NameIndex, validate_with_index as _validate_with_index
 
 
 BASE_URL = _pylinks.url.create(url="https://anaconda.org")
 
+_NAME_INDICES: dict[str, _NameIndex] = {}
+
 
 class Package:
     """A Conda package."""
@@ -36,8 +38,12 @@ class Package:
             )
         self._name = name
         self._channel = channel
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            if channel not in _NAME_INDICES or not _validate_with_index(
+                _NAME_INDICES[channel], name, self.homepage
+            ):
+                self._pending_validation = _pylinks.validation.validate(self)
 
     def __repr__(self):
         return f"conda.Package(name={self.name}, channel={self.channel}) @ {self.homepage}"
@@ -58,9 +64,34 @@ class Package:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the package homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return BASE_URL / self.channel / self.name
 
 
+def name_index(channel: str = "conda-forge") -> _NameIndex:
+    """
+    Local index of all package names in a Conda channel, built from the channel's `channeldata.json`.
+
+    Once the index is loaded (via `name_index(channel).load()`), packages found in it
+    are validated offline. Packages not found in it are validated online,
+    unless the index is set to be strict (`name_index(channel).strict = True`).
+
+    Parameters
+    ----------
+    channel : str, default: 'conda-forge'
+        The channel hosting the packages.
+    """
+    if channel not in _NAME_INDICES:
+        _NAME_INDICES[channel] = _NameIndex(
+            name=f"conda-{channel}",
+            source_url=f"https://conda.anaconda.org/{channel}/channeldata.json",
+            extract=lambda data: data["packages"].keys(),
+            normalize=str.lower,
+        )
+    return _NAME_INDICES[channel]
+
+
 def package(name: str, channel: str, validate: Optional[bool] = None) -> Package:
     """
     Create a new URL generator for a Conda package.
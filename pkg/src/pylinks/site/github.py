@@ -6,7 +6,6 @@ import re
 from typing import Literal, Optional
 
 # Non-standard libraries
-import requests
 import pylinks as _pylinks
 
 
@@ -32,8 +31,9 @@ class User:
                 "GitHub usernames can only contain alphanumeric characters and dashes."
             )
         self._name = name
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            self._pending_validation = _pylinks.validation.validate(self)
         return
 
     def __str__(self):
@@ -50,6 +50,8 @@ class User:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the GitHub user's homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return BASE_URL / self.name
 
     def repo(self, repo_name: str, validate: Optional[bool] = None) -> "Repo":
@@ -87,8 +89,9 @@ class Repo:
             raise ValueError(
                 'GitHub repository names can only contain "_", "-", ".", and alphanumeric characters.'
             )
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            self._pending_validation = _pylinks.validation.validate(self)
         return
 
     def __str__(self):
@@ -110,6 +113,8 @@ class Repo:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the repository's homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return self.user.homepage / self.name
 
     def workflow(self, filename: str) -> _pylinks.url.URL:
@@ -263,8 +268,9 @@ class Branch:
             raise ValueError(
                 'GitHub branch names can only contain "_", "-", ".", "/", and alphanumeric characters.'
             )
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            self._pending_validation = _pylinks.validation.validate(self)
         return
 
     @property
@@ -275,6 +281,8 @@ class Branch:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the branch's homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return self.repo.homepage / "tree" / self.name
 
     @property
@@ -2,7 +2,6 @@
 
 
 # Non-standard libraries
-import requests
 import pylinks as _pylinks
 
 
@@ -30,8 +29,9 @@ class Package:
             raise TypeError(f"`package` must be a string, not {type(package)}.")
         self._platform = platform
         self._package = package
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            self._pending_validation = _pylinks.validation.validate(self)
         return
 
     @property
@@ -47,6 +47,8 @@ class Package:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the package's homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return BASE_URL / self._platform / self._package
 
     def dependencies(self, version: str) -> _pylinks.url.URL:
@@ -6,12 +6,20 @@ import re
 from typing import Optional
 
 # Non-standard libraries
-import requests
 import pylinks as _pylinks
+from pylinks.site._name_index import NameIndex as _NameIndex, validate_with_index as _validate_with_index
 
 
 BASE_URL = _pylinks.url.create("https://pypi.org")
 
+_NAME_INDEX = _NameIndex(
+    name="pypi",
+    source_url="https://pypi.org/simple/",
+    extract=lambda data: (project["name"] for project in data["projects"]),
+    normalize=lambda name: re.sub(r"[-_.]+", "-", name).lower(),
+    headers={"Accept": "application/vnd.pypi.simple.v1+json"},
+)
+
 
 class Package:
     """A PyPI Python package."""
@@ -33,8 +41,10 @@ class Package:
                 "Distribution name is invalid; see https://peps.python.org/pep-0508/#names."
             )
         self._name = name
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.homepage)).raise_for_status()
+            if not _validate_with_index(_NAME_INDEX, name, self.homepage):
+                self._pending_validation = _pylinks.validation.validate(self)
 
     @property
     def name(self) -> str:
@@ -44,9 +54,23 @@ class Package:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the package homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return BASE_URL / "project" / self.name
 
 
+def name_index() -> _NameIndex:
+    """
+    Local index of all package names on PyPI, built from the
+    [simple repository API](https://peps.python.org/pep-0691/).
+
+    Once the index is loaded (via `name_index().load()`), packages found in it
+    are validated offline. Packages not found in it are validated online,
+    unless the index is set to be strict (`name_index().strict = True`).
+    """
+    return _NAME_INDEX
+
+
 def package(name: str, validate: Optional[bool] = None) -> Package:
     """
     Create a new URL generator for a PyPI package.
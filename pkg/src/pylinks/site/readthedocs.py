@@ -5,7 +5,6 @@
 from typing import Optional
 
 # Non-standard libraries
-import requests
 import pylinks as _pylinks
 
 
@@ -28,8 +27,9 @@ class Project:
         if not isinstance(name, str):
             raise TypeError(f"`name` must be a string, not {type(name)}.")
         self._name = name
+        self._pending_validation = None
         if validate is True or (validate is None and not _pylinks.settings.offline_mode):
-            requests.get(str(self.project_home)).raise_for_status()
+            self._pending_validation = _pylinks.validation.validate(self)
         return
 
     @property
@@ -40,8 +40,15 @@ class Project:
     @property
     def project_home(self) -> _pylinks.url.URL:
         """URL of the project's homepage. This is not the homepage of the website."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return BASE_URL / "projects" / self.name
 
+    @property
+    def validation_url(self) -> _pylinks.url.URL:
+        """URL used to validate the existence of the project online, i.e. `project_home`."""
+        return self.project_home
+
     @property
     def build_status(self) -> _pylinks.url.URL:
         """URL of the webpage showing an overview of the website's build status."""
@@ -50,6 +57,8 @@ class Project:
     @property
     def homepage(self) -> _pylinks.url.URL:
         """URL of the website's homepage."""
+        if self._pending_validation:
+            self._pending_validation = _pylinks.validation.resolve(self._pending_validation)
         return _pylinks.url.create(f"https://{self.name}.readthedocs.io")
 
 
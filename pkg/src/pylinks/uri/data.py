@@ -3,18 +3,74 @@
 """
 
 import base64 as _base64
+import binascii as _binascii
+import contextlib as _contextlib
+import inspect as _inspect
+import io as _io
+import mmap as _mmap
+import multiprocessing as _multiprocessing
+import pickle as _pickle
+from concurrent import futures as _futures
 import re as _re
 from pathlib import Path as _Path
 import dataclasses as _dataclasses
-from typing import Literal as _Literal
+from typing import (
+    Literal as _Literal,
+    BinaryIO as _BinaryIO,
+    TextIO as _TextIO,
+    Iterator as _Iterator,
+    NamedTuple as _NamedTuple,
+    Iterable as _Iterable,
+)
+from urllib.parse import quote_from_bytes as _quote_from_bytes, unquote_to_bytes as _unquote_to_bytes
 
+import requests as _requests
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+
+from pylinks._cache import BlobCache as _BlobCache
+from pylinks._settings import settings as _settings
 from pylinks.url import URL as _URL
 from pylinks.http import request as _request
 from pylinks import media_type as _media_type
-from pylinks.exception.uri import PyLinksDataURIParseError as _PyLinksDataURIParseError
+from pylinks.exception.uri import (
+    PyLinksDataURIParseError as _PyLinksDataURIParseError,
+    PyLinksDataURIDecodeError as _PyLinksDataURIDecodeError,
+)
 from pylinks.exception.base import PyLinksFileNotFoundError as _PyLinksFileNotFoundError
 
 
+_cache = _BlobCache("data_uri")
+"""On-disk cache of data URIs created from files and URLs; see `clear_cache`."""
+
+_BASE64_IGNORED = _re.compile(r"\s+")
+"""Characters ignored in base64 data, i.e. whitespace from line wrapping; all else is strictly validated."""
+
+_PERCENT_SAFE = "!$&'()*+,;=:@/?-._~"
+"""Characters (besides ASCII letters and digits) that are not percent-encoded in data URI payloads."""
+_PERCENT_SAFE_BYTES = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789" + _PERCENT_SAFE.encode()
+)
+
+_SCAN_HEADER = (
+    r"(?<![\w.+\-])data:"
+    r"(?P<media_type>[^\s,;\"'()<>`]{0,255}+(?:;(?!base64,)[^\s,;\"'()<>`]{0,255}+){0,16}+)"
+    r"(?P<base64>;base64)?,"
+)
+"""Pattern of a data URI header.
+
+Its length is bounded and its quantifiers are possessive,
+so that the cost of each match attempt is independent of the document size.
+"""
+_SCAN_HEADER_STR = _re.compile(_SCAN_HEADER, _re.IGNORECASE)
+_SCAN_HEADER_BYTES = _re.compile(_SCAN_HEADER.encode(), _re.IGNORECASE)
+_SCAN_END = r"[\s\"'()<>`]"
+_SCAN_END_STR = _re.compile(_SCAN_END)
+_SCAN_END_BYTES = _re.compile(_SCAN_END.encode())
+# Closing quotes of quoted URIs, by opening quote (as a character, or a byte value for binary sources)
+_SCAN_QUOTES_STR = {'"': _re.compile('"'), "'": _re.compile("'")}
+_SCAN_QUOTES_BYTES = {ord('"'): _re.compile(b'"'), ord("'"): _re.compile(b"'")}
+
+
 @_dataclasses.dataclass
 class DataURI:
     """A data URI.
@@ -38,6 +94,217 @@ class DataURI:
             media_type += ";base64"
         return f"data:{media_type},{self.data}"
 
+    def decode(self, as_memoryview: bool = False) -> bytes | memoryview:
+        """Decode the data to bytes.
+
+        Both base64 and percent-encoded (URL-encoded) data are supported.
+        Base64 data is validated strictly (ignoring only whitespace),
+        the same as in `iter_decode` and `decode_to`.
+
+        Parameters
+        ----------
+        as_memoryview : bool, default: False
+            Return a read-only memoryview over the decoded bytes,
+            which can be sliced and passed on without further copies.
+
+        Returns
+        -------
+        bytes | memoryview
+            The decoded data.
+
+        Raises
+        ------
+        pylinks.exception.uri.PyLinksDataURIDecodeError
+            If the data is not valid, e.g. base64 data with characters outside the alphabet
+            or with data after the padding.
+        """
+        data = self.data or ""
+        if self.base64:
+            data = _BASE64_IGNORED.sub("", data)
+        decoded = self._decode_chunk(data)
+        return memoryview(decoded) if as_memoryview else decoded
+
+    def iter_decode(self, chunk_size: int = 2 ** 18) -> _Iterator[bytes]:
+        """Decode the data lazily, in chunks.
+
+        Only about `chunk_size` characters of the data are decoded at a time,
+        so that very large URIs can be processed with bounded additional memory.
+
+        Parameters
+        ----------
+        chunk_size : int, default: 262144
+            Number of encoded characters to decode at a time.
+
+        Yields
+        ------
+        bytes
+            Consecutive chunks of the decoded data.
+        """
+        data = self.data or ""
+        chunk_size = max(chunk_size, 4)
+        carry = ""
+        padded = False
+        for start in range(0, len(data), chunk_size):
+            chunk = carry + data[start:start + chunk_size]
+            if self.base64:
+                chunk = _BASE64_IGNORED.sub("", chunk)
+                cut = len(chunk) - len(chunk) % 4
+            else:
+                # Do not split a percent-encoded octet between chunks
+                escape = chunk.rfind("%", -2)
+                cut = escape if escape != -1 else len(chunk)
+            chunk, carry = chunk[:cut], chunk[cut:]
+            if chunk:
+                if padded:
+                    # Padding at the end of a previous chunk was not the end of the data
+                    raise _PyLinksDataURIDecodeError("Excess data after padding", str(self))
+                yield self._decode_chunk(chunk)
+                padded = self.base64 and chunk.endswith("=")
+        if carry:
+            if padded:
+                raise _PyLinksDataURIDecodeError("Excess data after padding", str(self))
+            yield self._decode_chunk(carry)
+        return
+
+    def decode_to(self, output: str | _Path | _BinaryIO, chunk_size: int = 2 ** 18) -> int:
+        """Decode the data and write it to a file or binary stream.
+
+        Decoding is done lazily (see `iter_decode`),
+        so the decoded data is never held in memory as a whole.
+
+        Parameters
+        ----------
+        output : str | pathlib.Path | typing.BinaryIO
+            Path to the output file (which is overwritten),
+            or a binary stream to write the data to at its current position.
+        chunk_size : int, default: 262144
+            Number of encoded characters to decode at a time.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        if isinstance(output, (str, _Path)):
+            with open(output, "wb") as stream:
+                return self.decode_to(stream, chunk_size=chunk_size)
+        written = 0
+        for chunk in self.iter_decode(chunk_size=chunk_size):
+            written += output.write(chunk)
+        return written
+
+    def _decode_chunk(self, chunk: str) -> bytes:
+        try:
+            if self.base64:
+                return _binascii.a2b_base64(chunk, strict_mode=True)
+            return _unquote_to_bytes(chunk)
+        except (_binascii.Error, ValueError) as e:
+            raise _PyLinksDataURIDecodeError(str(e), str(self)) from None
+
+
+class DataURIMatch(_NamedTuple):
+    """
+    A data URI found in a document.
+
+    The match only holds offsets into the document, so the (possibly large) payload
+    is not copied; it can be accessed as `source[match.data_start:match.end]`.
+
+    Attributes
+    ----------
+    start : int
+        Offset of the first character (or byte, for binary sources) of the URI in the document.
+    end : int
+        Offset right after the last character (or byte) of the URI in the document.
+    data_start : int
+        Offset of the first character (or byte) of the payload, i.e., right after the comma.
+    media_type : str
+        The media type of the data, including any parameters, as written in the URI
+        (an empty string if it was omitted).
+    base64 : bool
+        Whether the data is base64 encoded.
+    """
+
+    start: int
+    end: int
+    data_start: int
+    media_type: str
+    base64: bool
+
+
+def scan(source: str | bytes | bytearray | memoryview | _mmap.mmap) -> _Iterator[DataURIMatch]:
+    """Find all data URIs in a document, e.g. HTML, CSS, or Markdown.
+
+    The document is scanned in a single linear pass: only the short header
+    (`data:` to the comma) of each URI is matched by a regular expression,
+    while the payload end is found by a plain search for its terminator,
+    i.e., the enclosing quote when the URI is quoted,
+    and otherwise the first whitespace, quote, bracket or parenthesis.
+
+    Parameters
+    ----------
+    source : str | bytes | bytearray | memoryview | mmap.mmap
+        The document. For binary sources, offsets are in bytes.
+
+    Yields
+    ------
+    DataURIMatch
+        Offsets and header information of each data URI, in order of appearance.
+    """
+    is_str = isinstance(source, str)
+    header_pattern = _SCAN_HEADER_STR if is_str else _SCAN_HEADER_BYTES
+    end_pattern = _SCAN_END_STR if is_str else _SCAN_END_BYTES
+    # Copy, so that quotes without a closing match can be dropped (keeping the scan linear)
+    quote_patterns = dict(_SCAN_QUOTES_STR if is_str else _SCAN_QUOTES_BYTES)
+    position = 0
+    while header := header_pattern.search(source, position):
+        start = header.start()
+        data_start = header.end()
+        quote = source[start - 1] if start else None
+        terminator = None
+        if quote in quote_patterns:
+            terminator = quote_patterns[quote].search(source, data_start)
+            if terminator is None:
+                del quote_patterns[quote]
+        if terminator is None:
+            terminator = end_pattern.search(source, data_start)
+        end = terminator.start() if terminator else len(source)
+        media_type = header.group("media_type")
+        yield DataURIMatch(
+            start=start,
+            end=end,
+            data_start=data_start,
+            media_type=media_type if is_str else media_type.decode("ascii", errors="replace"),
+            base64=header.group("base64") is not None,
+        )
+        position = end
+    return
+
+
+def scan_file(filepath: str | _Path) -> _Iterator[DataURIMatch]:
+    """Find all data URIs in a file; see `scan`.
+
+    The file is memory-mapped, so it is never fully loaded into memory.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file. Offsets of the yielded matches are in bytes.
+
+    Yields
+    ------
+    DataURIMatch
+        Offsets and header information of each data URI, in order of appearance.
+    """
+    with open(filepath, "rb") as file:
+        try:
+            mapped = _mmap.mmap(file.fileno(), 0, access=_mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped.
+            return
+        with mapped:
+            yield from scan(mapped)
+    return
+
 
 def parse(data_uri: str) -> DataURI:
     """Parse a data URI.
@@ -76,6 +343,7 @@ def create_from_path(
     media_type: _media_type.MediaType | None = None,
     guess_media_type: bool = True,
     base64: bool = False,
+    use_cache: bool = True,
 ) -> DataURI:
     if path_type == "file":
         return create_from_filepath(
@@ -83,6 +351,7 @@ def create_from_path(
             media_type=media_type,
             guess_media_type=guess_media_type,
             base64=base64,
+            use_cache=use_cache,
         )
     elif path_type == "url":
         return create_from_url(
@@ -90,6 +359,7 @@ def create_from_path(
             media_type=media_type,
             guess_media_type=guess_media_type,
             base64=base64,
+            use_cache=use_cache,
         )
     raise ValueError(f"path_type '{path_type}' is invalid.")
 
@@ -99,6 +369,8 @@ def create_from_url(
     media_type: _media_type.MediaType | None = None,
     guess_media_type: bool = True,
     base64: bool = False,
+    use_cache: bool = True,
+    session: _requests.Session | None = None,
 ) -> DataURI:
     """Create a data URI from a URL.
 
@@ -114,6 +386,13 @@ def create_from_url(
         and will raise an error if the media type cannot be guessed.
     base64 : bool, default: False
         Whether to base64 encode the data.
+    use_cache : bool, default: True
+        Whether to use the on-disk data URI cache (only available when `pylinks.settings.cache_dir` is set).
+        A cached data URI is revalidated with a conditional request
+        (using the 'ETag' and 'Last-Modified' headers of the previous response),
+        so unchanged data is neither downloaded nor encoded again.
+    session : requests.Session, optional
+        Session to send the request with; see `pylinks.http.request`.
 
     Returns
     -------
@@ -123,8 +402,27 @@ def create_from_url(
     url = str(url)
     if media_type is None and guess_media_type:
         media_type = _media_type.guess_from_uri(url)
-    data = _request(url, response_type="str" if not base64 else "bytes")
-    return create_from_data(data=data, media_type=media_type, base64=base64)
+    if not use_cache or _settings.cache_dir is None:
+        data = _request(url, response_type="str" if not base64 else "bytes", session=session)
+        return create_from_data(data=data, media_type=media_type, base64=base64)
+    key = f"url|{url}|{media_type or ''}|{base64}"
+    cached = _cache.get(key)
+    headers = {}
+    if cached is not None:
+        if cached[1].get("etag"):
+            headers["If-None-Match"] = cached[1]["etag"]
+        if cached[1].get("last_modified"):
+            headers["If-Modified-Since"] = cached[1]["last_modified"]
+    response = _request(url, headers=headers, response_type=None, session=session)
+    if response.status_code == 304 and cached is not None:
+        return DataURI(media_type=media_type, data=cached[0], base64=base64)
+    data_uri = create_from_data(
+        data=response.content if base64 else response.text, media_type=media_type, base64=base64
+    )
+    meta = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+    if meta["etag"] or meta["last_modified"]:
+        _cache.set(key, data_uri.data, meta=meta, max_size=_settings.data_uri_cache_size)
+    return data_uri
 
 
 def create_from_filepath(
@@ -132,6 +430,7 @@ def create_from_filepath(
     media_type: _media_type.MediaType | None = None,
     guess_media_type: bool = True,
     base64: bool = False,
+    use_cache: bool = True,
 ) -> DataURI:
     """Create a data URI from a file.
 
@@ -142,11 +441,16 @@ def create_from_filepath(
     media_type : pylinks.media_type.MediaType | str | None, optional
         Media (MIME) Type of the data.
     guess_media_type : bool, default: True
-        Whether to guess the media type from the URL.
+        Whether to guess the media type from the file extension,
+        or from the file content when the extension is unknown.
         This is only done if the media type is not provided,
         and will raise an error if the media type cannot be guessed.
     base64 : bool, default: False
         Whether to base64 encode the data.
+    use_cache : bool, default: True
+        Whether to use the on-disk data URI cache (only available when `pylinks.settings.cache_dir` is set).
+        Cached data URIs are keyed by the file's path, modification time and size,
+        so a file is only read and encoded again after it has changed.
 
     Returns
     -------
@@ -157,9 +461,233 @@ def create_from_filepath(
     if not filepath.is_file():
         raise _PyLinksFileNotFoundError(filepath)
     if media_type is None and guess_media_type:
-        media_type = _media_type.guess_from_uri(str(filepath))
+        media_type = _media_type.guess_from_filepath(filepath)
+    use_cache = use_cache and _settings.cache_dir is not None
+    if use_cache:
+        stat = filepath.stat()
+        key = f"file|{filepath}|{stat.st_mtime_ns}|{stat.st_size}|{media_type or ''}|{base64}"
+        cached = _cache.get(key)
+        if cached is not None:
+            return DataURI(media_type=media_type, data=cached[0], base64=base64)
     data = filepath.read_bytes() if base64 else filepath.read_text()
-    return create_from_data(data=data, media_type=media_type, base64=base64)
+    data_uri = create_from_data(data=data, media_type=media_type, base64=base64)
+    if use_cache:
+        _cache.set(key, data_uri.data, max_size=_settings.data_uri_cache_size)
+    return data_uri
+
+
+def write_from_filepath(
+    filepath: str | _Path,
+    output: str | _Path | _BinaryIO | _TextIO,
+    media_type: _media_type.MediaType | None = None,
+    guess_media_type: bool = True,
+    chunk_size: int = 3 * 2 ** 16,
+) -> int:
+    """Write a base64 data URI of a file to a file or stream, without loading the whole file.
+
+    The file is read and encoded in chunks, and each encoded chunk is written
+    to the output right away, so memory usage is bounded by `chunk_size`
+    regardless of the file size.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file.
+    output : str | pathlib.Path | typing.BinaryIO | typing.TextIO
+        Path to the output file (which is overwritten),
+        or a binary or text stream to write the data URI to at its current position.
+    media_type : pylinks.media_type.MediaType | str | None, optional
+        Media (MIME) Type of the data.
+    guess_media_type : bool, default: True
+        Whether to guess the media type from the file extension,
+        or from the file content when the extension is unknown.
+        This is only done if the media type is not provided,
+        and will raise an error if the media type cannot be guessed.
+    chunk_size : int, default: 196608
+        Number of bytes to read and encode at a time.
+        It is rounded down to a multiple of 3, so that chunks encode without padding.
+
+    Returns
+    -------
+    int
+        Number of characters written.
+    """
+    filepath = _Path(filepath).resolve()
+    if not filepath.is_file():
+        raise _PyLinksFileNotFoundError(filepath)
+    if media_type is None and guess_media_type:
+        media_type = _media_type.guess_from_filepath(filepath)
+    chunk_size = max(chunk_size - chunk_size % 3, 3)
+    if isinstance(output, (str, _Path)):
+        with open(output, "wb") as stream:
+            return _write_base64(filepath, stream, media_type, chunk_size)
+    return _write_base64(filepath, output, media_type, chunk_size)
+
+
+def _write_base64(
+    filepath: _Path,
+    stream: _BinaryIO | _TextIO,
+    media_type: _media_type.MediaType | None,
+    chunk_size: int,
+) -> int:
+    is_text = isinstance(stream, _io.TextIOBase)
+    header = f"data:{media_type or ''};base64,"
+    written = stream.write(header if is_text else header.encode())
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filepath, "rb") as file:
+        while True:
+            # Fill the whole buffer (short reads would otherwise introduce padding)
+            size = 0
+            while size < chunk_size:
+                read = file.readinto(view[size:])
+                if not read:
+                    break
+                size += read
+            if not size:
+                break
+            encoded = _base64.b64encode(view[:size])
+            written += stream.write(encoded.decode("ascii") if is_text else encoded)
+            if size < chunk_size:
+                break
+    return written
+
+
+def create_many(
+    sources: _Iterable[str | _Path | _URL],
+    media_type: _media_type.MediaType | None = None,
+    guess_media_type: bool = True,
+    base64: bool = True,
+    use_cache: bool = True,
+    max_processes: int | None = None,
+    max_threads: int = 8,
+    return_exceptions: bool = False,
+) -> list[DataURI | Exception]:
+    """Create data URIs from many files and URLs concurrently.
+
+    Files are read and encoded in a process pool, since encoding is CPU-bound,
+    while URLs are fetched in a thread pool over a shared connection pool (see `create_from_url`).
+    Both run at the same time. Worker processes are started with the 'spawn' method,
+    so when calling this function from a script, guard the call with `if __name__ == "__main__":`.
+
+    Parameters
+    ----------
+    sources : Iterable[str | pathlib.Path | pylinks.url.URL]
+        Paths to files, and/or URLs. Strings starting with 'http://' or 'https://'
+        (and `pylinks.url.URL` objects) are treated as URLs; everything else as file paths.
+    media_type : pylinks.media_type.MediaType | str | None, optional
+        Media (MIME) Type of all data. If not provided, it is guessed for each source separately.
+    guess_media_type : bool, default: True
+        Whether to guess the media type of each source; see `create_from_filepath` and `create_from_url`.
+    base64 : bool, default: True
+        Whether to base64 encode the data.
+    use_cache : bool, default: True
+        Whether to use the on-disk data URI cache; see `create_from_filepath` and `create_from_url`.
+    max_processes : int, optional
+        Maximum number of processes for files. Defaults to the number of CPUs.
+    max_threads : int, default: 8
+        Maximum number of concurrent requests for URLs.
+    return_exceptions : bool, default: False
+        Whether to return errors in place of the data URIs of failed sources, instead of raising them.
+
+    Returns
+    -------
+    list[pylinks.uri.data.DataURI | Exception]
+        Data URIs (or errors, if `return_exceptions` is True), in the same order as `sources`.
+    """
+    sources = list(sources)
+    kwargs = dict(media_type=media_type, guess_media_type=guess_media_type, base64=base64, use_cache=use_cache)
+    is_url = [isinstance(source, _URL) or str(source).startswith(("http://", "https://")) for source in sources]
+    futures = []
+    with (
+        _futures.ProcessPoolExecutor(
+            max_workers=max_processes,
+            # Forking would copy held locks and the SQLite connection of the cache into the workers.
+            mp_context=_multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(_settings.cache_dir, _settings.data_uri_cache_size),
+        ) if not all(is_url) else _contextlib.nullcontext() as process_pool,
+        _futures.ThreadPoolExecutor(max_workers=max_threads) as thread_pool,
+        _requests.Session() as session,
+    ):
+        adapter = _HTTPAdapter(pool_maxsize=max_threads)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        for source, source_is_url in zip(sources, is_url):
+            if source_is_url:
+                futures.append(thread_pool.submit(create_from_url, url=source, session=session, **kwargs))
+            else:
+                futures.append(process_pool.submit(_create_from_filepath, filepath=source, **kwargs))
+        try:
+            results = []
+            for source, future in zip(sources, futures):
+                try:
+                    result = future.result()
+                    if isinstance(result, _WorkerError):
+                        result.reraise()
+                    results.append(result)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        finally:
+            for future in futures:
+                future.cancel()
+    return results
+
+
+class _WorkerError(_NamedTuple):
+    """A picklable description of an error raised in a worker process.
+
+    PyLinks errors cannot be pickled as they are,
+    so they are described by their type and constructor arguments,
+    and recreated in the parent process.
+    """
+    exception: Exception | None
+    error_type: type
+    arguments: dict
+    message: str
+
+    @classmethod
+    def from_exception(cls, exception: Exception) -> "_WorkerError":
+        try:
+            _pickle.loads(_pickle.dumps(exception))
+        except Exception:
+            pass
+        else:
+            return cls(exception=exception, error_type=type(exception), arguments={}, message=str(exception))
+        parameters = _inspect.signature(type(exception)).parameters
+        arguments = {name: getattr(exception, name) for name in parameters if hasattr(exception, name)}
+        try:
+            _pickle.dumps(arguments)
+        except Exception:
+            arguments = {}
+        return cls(exception=None, error_type=type(exception), arguments=arguments, message=repr(exception))
+
+    def reraise(self):
+        """Raise the error in the current process."""
+        if self.exception is not None:
+            raise self.exception
+        try:
+            error = self.error_type(**self.arguments)
+        except Exception:
+            error = RuntimeError(f"{self.error_type.__name__} raised in worker process: {self.message}")
+        raise error
+
+
+def _create_from_filepath(**kwargs) -> DataURI | _WorkerError:
+    """Run `create_from_filepath` in a worker process, returning a picklable error on failure."""
+    try:
+        return create_from_filepath(**kwargs)
+    except Exception as e:
+        return _WorkerError.from_exception(e)
+
+
+def _init_worker(cache_dir: _Path | None, data_uri_cache_size: int) -> None:
+    """Copy the relevant settings of the parent process into a worker process."""
+    _settings.cache_dir = cache_dir
+    _settings.data_uri_cache_size = data_uri_cache_size
+    return
 
 
 def create_from_data(
@@ -198,3 +726,155 @@ def create_from_data(
     else:
         data_str = data
     return DataURI(media_type=media_type, data=data_str, base64=base64)
+
+
+def percent_encode(data: str | bytes) -> str:
+    """Percent-encode data for use as a (non-base64) data URI payload.
+
+    Strings are encoded as UTF-8 first.
+    """
+    return _quote_from_bytes(data.encode() if isinstance(data, str) else data, safe=_PERCENT_SAFE)
+
+
+def estimate_size(
+    filepath: str | _Path,
+    media_type: _media_type.MediaType | str | None = None,
+    base64: bool = True,
+    chunk_size: int = 2 ** 20,
+) -> int:
+    """Calculate the length of the data URI of a file, without creating it.
+
+    For base64 encoding, the length is calculated from the file size alone.
+    For percent-encoding (see `percent_encode`), the file is read in chunks
+    to count the bytes that need escaping, so memory usage is bounded by `chunk_size`.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file.
+    media_type : pylinks.media_type.MediaType | str | None, optional
+        Media (MIME) Type of the data, as it will appear in the URI.
+    base64 : bool, default: True
+        Whether to calculate the length for base64 encoding, or for percent-encoding.
+    chunk_size : int, default: 1048576
+        Number of bytes to read at a time, for percent-encoding.
+
+    Returns
+    -------
+    int
+        Number of characters in the data URI.
+    """
+    header_size = len(str(DataURI(media_type=media_type or None, data="", base64=base64)))
+    if base64:
+        return header_size + 4 * -(-_Path(filepath).stat().st_size // 3)
+    size = header_size
+    with open(filepath, "rb") as file:
+        while chunk := file.read(chunk_size):
+            size += 3 * len(chunk) - 2 * (len(chunk) - len(chunk.translate(None, _PERCENT_SAFE_BYTES)))
+    return size
+
+
+@_dataclasses.dataclass
+class SizePolicy:
+    """A policy for deciding whether to inline a file as a data URI, or to link to it.
+
+    Attributes
+    ----------
+    max_size : int, default: 32768
+        Maximum length (in characters) of a data URI to inline,
+        for media types not in `max_size_per_type`.
+    max_size_per_type : dict[str, int], default: {}
+        Maximum length of inlined data URIs for specific media types.
+        Keys are either full media types without parameters (e.g., 'image/svg+xml'),
+        or types with a wildcard subtype (e.g., 'image/*'); the former take precedence.
+    compress_text : bool, default: True
+        Whether to use percent-encoding instead of base64 for text-based media types
+        (e.g., SVG, HTML, CSS, JSON), when it results in a shorter URI.
+    """
+    max_size: int = 32 * 1024
+    max_size_per_type: dict[str, int] = _dataclasses.field(default_factory=dict)
+    compress_text: bool = True
+
+    def limit(self, media_type: _media_type.MediaType | str | None) -> int:
+        """Get the maximum length of inlined data URIs for a media type."""
+        if not media_type:
+            return self.max_size
+        if isinstance(media_type, str):
+            media_type = _media_type.parse_cached(media_type)
+        essence = str(_dataclasses.replace(media_type, parameters=type(media_type.parameters)()))
+        if essence in self.max_size_per_type:
+            return self.max_size_per_type[essence]
+        return self.max_size_per_type.get(f"{media_type.type}/*", self.max_size)
+
+
+def inline_or_link(
+    filepath: str | _Path,
+    url: str | _URL,
+    policy: SizePolicy | None = None,
+    media_type: _media_type.MediaType | str | None = None,
+    guess_media_type: bool = True,
+) -> DataURI | str:
+    """Create a data URI from a file if it is small enough, otherwise return a URL to it.
+
+    The size of the data URI is calculated before it is created (see `estimate_size`),
+    so files that are too large are never read or encoded.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file.
+    url : str | pylinks.url.URL
+        External URL of the same file, used when it is too large to inline.
+    policy : SizePolicy, optional
+        Size thresholds and encoding preferences. Defaults to `SizePolicy()`.
+    media_type : pylinks.media_type.MediaType | str | None, optional
+        Media (MIME) Type of the data.
+    guess_media_type : bool, default: True
+        Whether to guess the media type from the file extension,
+        or from the file content when the extension is unknown.
+        This is only done if the media type is not provided,
+        and will raise an error if the media type cannot be guessed.
+
+    Returns
+    -------
+    pylinks.uri.data.DataURI | str
+        The data URI, or `url` as a string if the data URI would exceed the policy's limit.
+    """
+    policy = policy or SizePolicy()
+    filepath = _Path(filepath).resolve()
+    if not filepath.is_file():
+        raise _PyLinksFileNotFoundError(filepath)
+    if media_type is None and guess_media_type:
+        media_type = _media_type.guess_from_filepath(filepath)
+    limit = policy.limit(media_type)
+    size = estimate_size(filepath, media_type=media_type, base64=True)
+    if policy.compress_text and _is_text(media_type):
+        # Percent-encoded data is at least 3/4 the length of base64-encoded data,
+        # so counting is only worthwhile when base64 is not far above the limit.
+        if size <= 2 * limit:
+            percent_size = estimate_size(filepath, media_type=media_type, base64=False)
+            if percent_size < size:
+                if percent_size > limit:
+                    return str(url)
+                return DataURI(media_type=media_type, data=percent_encode(filepath.read_bytes()), base64=False)
+    if size > limit:
+        return str(url)
+    return create_from_filepath(filepath, media_type=media_type, guess_media_type=False, base64=True)
+
+
+def _is_text(media_type: _media_type.MediaType | str | None) -> bool:
+    if not media_type:
+        return False
+    if isinstance(media_type, str):
+        media_type = _media_type.parse_cached(media_type)
+    return (
+        media_type.type == "text"
+        or any(suffix in ("xml", "json") for suffix in media_type.suffixes)
+        or (media_type.type == "application" and media_type.subtype in ("json", "xml", "javascript", "ecmascript"))
+    )
+
+
+def clear_cache() -> None:
+    """Remove all data URIs from the on-disk cache."""
+    _cache.clear()
+    return
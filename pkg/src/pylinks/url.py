@@ -1,10 +1,31 @@
 """Create and modify URLs."""
 
 from __future__ import annotations
+import functools
+import hashlib
+import mmap
 import re
+import sys
+import threading
 import urllib
 import webbrowser
-from typing import Literal, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Literal, NamedTuple, Optional, TextIO
+
+
+_URL_PATTERN = re.compile(
+    r"^(?P<base_url>[^?#]+)(?:\?(?P<query_string>[^#]+))?(?:#(?P<fragment>.*))?$"
+)
+# Strings made only of these characters are left unchanged by `urllib.parse.quote`,
+# regardless of the `safe` argument, and by `urllib.parse.unquote`.
+_UNRESERVED_PATTERN = re.compile(r"[A-Za-z0-9_.~-]*")
+_PERCENT_ENCODING_PATTERN = re.compile(r"%([0-9A-Fa-f]{2})")
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+# URLs embedded in text, Markdown or HTML; delimiters and brackets end the match.
+_SCAN_PATTERN_STR = re.compile(r"https?://[^\s<>\"'`()\[\]{}|\\^]+")
+_SCAN_PATTERN_BYTES = re.compile(rb"https?://[^\s<>\"'`()\[\]{}|\\^]+")
+_SCAN_TRAILING_PUNCTUATION = ".,;:!?*_~"
 
 
 class URL:
@@ -87,23 +108,9 @@ class URL:
     @property
     def query_string(self) -> str | None:
         """The complete query string, e.g. 'title=my-title&style=bold'"""
-        if not self.queries:
-            return
-        queries = []
-        for key, val in self.queries.items():
-            if val is None:
-                continue
-            q_key = urllib.parse.quote(urllib.parse.unquote(str(key)), safe=self.quote_safe)
-            if isinstance(val, bool) and val is True:
-                queries.append(q_key)
-            else:
-                q_val = (
-                    val.decode("utf8")
-                    if isinstance(val, bytes)
-                    else urllib.parse.quote(urllib.parse.unquote(str(val)), safe=self.quote_safe)
-                )
-                queries.append(f"{q_key}={q_val}")
-        return self.query_delimiter.join(queries)
+        return encode_queries(
+            self.queries, quote_safe=self.quote_safe, query_delimiter=self.query_delimiter
+        )
 
     def copy(self) -> URL:
         """Create a new copy."""
@@ -165,10 +172,756 @@ def create(
     )
 
 
+class URLTrie:
+    """
+    A set of URLs, stored as a trie of scheme, host and path segments.
+
+    URLs sharing a scheme, host and leading path segments share the corresponding trie nodes,
+    and all but the last segments are interned, so that large collections of similar URLs
+    take only a fraction of the memory of a flat set of strings.
+    The trie supports membership tests, iteration,
+    and efficient retrieval of all URLs under a given prefix.
+    """
+
+    class _Node:
+        __slots__ = ("children", "tails")
+
+        def __init__(self, tails: str | None = None):
+            # Child nodes by segment. A child of None stands for a leaf holding only
+            # the URL without query string and fragment (the most common case),
+            # so that no node has to be allocated for it.
+            self.children: dict[str, URLTrie._Node | None] | None = None
+            # Query string and fragment ('?...#...') of URLs ending at this node:
+            # None if there are none, a string if there is only one
+            # (an empty string for a URL without query string and fragment),
+            # and a set of strings otherwise.
+            self.tails: str | set[str] | None = tails
+
+    _LEAF = _Node(tails="")
+    """Read-only node standing for a leaf child of None."""
+
+    def __init__(self, urls: Iterable[str | URL] = ()):
+        """
+        Parameters
+        ----------
+        urls : Iterable[str | URL], optional
+            URLs to initially add to the trie.
+        """
+        self._root = URLTrie._Node()
+        self._len = 0
+        for url in urls:
+            self.add(url)
+        return
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, url: str | URL) -> bool:
+        segments, tail = self._split(url)
+        node = self._find(segments)
+        if node is None or node.tails is None:
+            return False
+        return node.tails == tail if isinstance(node.tails, str) else tail in node.tails
+
+    def __iter__(self) -> Iterator[URL]:
+        return self._iter_node(self._root, [])
+
+    def __repr__(self):
+        return f"URLTrie(size={self._len})"
+
+    def add(self, url: str | URL) -> None:
+        """
+        Add an HTTP(S) URL to the trie.
+
+        Raises
+        ------
+        ValueError
+            If the URL cannot be parsed by `create`.
+        """
+        url = str(url)
+        # URLs are re-created from their segments on iteration,
+        # so those that `create` would reject must not get into the trie.
+        try:
+            _process_url(url)
+        except ValueError as e:
+            raise ValueError(f"Invalid URL '{url}': {e}") from None
+        segments, tail = self._split(url)
+        node = self._root
+        for segment in segments[:-1]:
+            if node.children is None:
+                node.children = dict()
+            if segment in node.children:
+                child = node.children[segment]
+                if child is None:
+                    child = node.children[segment] = URLTrie._Node(tails="")
+            else:
+                child = node.children[sys.intern(segment)] = URLTrie._Node()
+            node = child
+        if node.children is None:
+            node.children = dict()
+        # Last segments are mostly unique (e.g. tags or filenames), so they are not interned.
+        segment = segments[-1]
+        if segment not in node.children:
+            node.children[segment] = None if tail == "" else URLTrie._Node(tails=tail)
+            self._len += 1
+            return
+        child = node.children[segment]
+        if child is None:
+            if tail == "":
+                return
+            child = node.children[segment] = URLTrie._Node(tails="")
+        if child.tails is None:
+            child.tails = tail
+        elif isinstance(child.tails, str):
+            if child.tails == tail:
+                return
+            child.tails = {child.tails, tail}
+        elif tail not in child.tails:
+            child.tails.add(tail)
+        else:
+            return
+        self._len += 1
+        return
+
+    def discard(self, url: str | URL) -> None:
+        """Remove a URL from the trie, if it is present."""
+        segments, tail = self._split(url)
+        path = [self._root]
+        for index, segment in enumerate(segments, start=1):
+            children = path[-1].children
+            if children is None or segment not in children:
+                return
+            child = children[segment]
+            if child is None:
+                if index < len(segments) or tail != "":
+                    return
+                child = URLTrie._Node(tails="")
+            path.append(child)
+        node = path[-1]
+        if node.tails is None:
+            return
+        if isinstance(node.tails, str):
+            if node.tails != tail:
+                return
+            node.tails = None
+        else:
+            if tail not in node.tails:
+                return
+            node.tails.discard(tail)
+            if len(node.tails) == 1:
+                node.tails = node.tails.pop()
+        self._len -= 1
+        # Prune nodes that no longer hold any URLs, and replace bare leaves with None
+        for parent, segment, child in zip(reversed(path[:-1]), reversed(segments), reversed(path[1:])):
+            if child.children:
+                break
+            if child.tails is not None:
+                if child.tails == "":
+                    parent.children[segment] = None
+                break
+            del parent.children[segment]
+            if not parent.children:
+                parent.children = None
+        return
+
+    def iter_prefix(self, prefix: str | URL) -> Iterator[URL]:
+        """
+        Iterate over all URLs under a given prefix.
+
+        The prefix is matched on whole path segments,
+        i.e. 'github.com/org/repo' matches 'https://github.com/org/repo/releases',
+        but not 'https://github.com/org/repo-2'.
+
+        Parameters
+        ----------
+        prefix : str | URL
+            The prefix, e.g. 'https://github.com/org/repo/releases'.
+            If the scheme is omitted (e.g. 'github.com/org/repo/releases'),
+            URLs with any scheme are matched.
+            Query strings and fragments of the prefix are ignored.
+
+        Yields
+        ------
+        URL
+            All URLs in the trie that start with the prefix.
+        """
+        prefix = str(prefix)
+        if "://" in prefix:
+            schemes = [prefix.split("://", 1)[0]]
+        else:
+            schemes = list(self._root.children or {})
+            prefix = f"http://{prefix}"
+        segments, _ = self._split(prefix)
+        for scheme in schemes:
+            node = self._find([scheme, *segments[1:]])
+            if node is not None:
+                yield from self._iter_node(node, [scheme, *segments[1:]])
+
+    def count_prefix(self, prefix: str | URL) -> int:
+        """Number of URLs under a given prefix; see `iter_prefix`."""
+        return sum(1 for _ in self.iter_prefix(prefix))
+
+    def _find(self, segments: list[str]) -> URLTrie._Node | None:
+        node = self._root
+        for segment in segments:
+            if node.children is None:
+                return
+            if segment not in node.children:
+                return
+            node = node.children[segment] or URLTrie._LEAF
+        return node
+
+    def _iter_node(self, node: URLTrie._Node, segments: list[str]) -> Iterator[URL]:
+        if node.tails is not None:
+            base = f"{segments[0]}://{"/".join(segments[1:])}"
+            for tail in (node.tails,) if isinstance(node.tails, str) else node.tails:
+                yield create(f"{base}{tail}")
+        for segment, child in (node.children or {}).items():
+            yield from self._iter_node(child or URLTrie._LEAF, [*segments, segment])
+
+    @staticmethod
+    def _split(url: str | URL) -> tuple[list[str], str]:
+        """Split a URL into a list of scheme, host and path segments, and a query-fragment tail."""
+        url = str(url)
+        scheme, _, rest = url.partition("://")
+        if not rest:
+            raise ValueError(f"URL '{url}' has no scheme.")
+        tail_start = len(rest)
+        for char in "?#":
+            index = rest.find(char)
+            if index != -1:
+                tail_start = min(tail_start, index)
+        path, tail = rest[:tail_start].rstrip("/"), rest[tail_start:]
+        return [scheme, *path.split("/")], tail
+
+
+def encode_queries(
+    queries: Optional[dict[str, str | bytes | bool | None]],
+    quote_safe: Optional[str] = "",
+    query_delimiter: str = "&",
+) -> str | None:
+    """
+    Encode query fields into a query string, e.g. 'title=my-title&style=bold'.
+
+    Keys and values are quoted in the same way as in `URL.query_string`;
+    values consisting only of unreserved ASCII characters are passed through as is,
+    and the quoted form of all other keys and values is memoized,
+    so that repeated serializations of the same fields are cheap.
+
+    Parameters
+    ----------
+    queries : dict[str, str | has_str | bytes | bool | None]
+        Query fields as a dictionary of key-value pairs.
+        Bytes values are decoded using UTF-8, but not quoted.
+        If the value is True, only the key is included, and if it is None, the field is skipped.
+    quote_safe : str, default: ''
+        Characters that should not be quoted.
+    query_delimiter : str, default: '&'
+        Delimiter for the query string.
+
+    Returns
+    -------
+    str | None
+        The query string, or None if `queries` is empty.
+    """
+    if not queries:
+        return
+    fields = []
+    for key, val in queries.items():
+        if val is None:
+            continue
+        q_key = _quote(key, quote_safe)
+        if val is True:
+            fields.append(q_key)
+        else:
+            q_val = val.decode("utf8") if isinstance(val, bytes) else _quote(val, quote_safe)
+            fields.append(f"{q_key}={q_val}")
+    return query_delimiter.join(fields)
+
+
+def pre_encode_queries(
+    queries: dict[str, str | bytes | bool | None],
+    quote_safe: Optional[str] = "",
+) -> dict[str, bytes | bool | None]:
+    """
+    Quote all keys and values of query fields once, ahead of serialization.
+
+    The returned dictionary can be used as `URL.queries` (or passed to `create`)
+    in place of the original fields, and produces the exact same query string;
+    since its values are bytes, they are not quoted again on each serialization.
+
+    Parameters
+    ----------
+    queries : dict[str, str | has_str | bytes | bool | None]
+        Query fields as a dictionary of key-value pairs.
+    quote_safe : str, default: ''
+        Characters that should not be quoted.
+        This must be the same as the `quote_safe` of the URL the fields are used in.
+
+    Returns
+    -------
+    dict[str, bytes | bool | None]
+        Query fields with quoted keys and UTF-8 encoded quoted values.
+    """
+    encoded = dict()
+    for key, val in queries.items():
+        if val is None or val is True or isinstance(val, bytes):
+            encoded[_quote(key, quote_safe)] = val
+        else:
+            encoded[_quote(key, quote_safe)] = _quote(val, quote_safe).encode("utf8")
+    return encoded
+
+
+def _quote(value, safe: Optional[str]) -> str:
+    """Quote a query key or value, i.e. `urllib.parse.quote(urllib.parse.unquote(str(value)))`."""
+    string = str(value)
+    if _UNRESERVED_PATTERN.fullmatch(string):
+        return string
+    return _quote_memoized(string, safe)
+
+
+@functools.lru_cache(maxsize=8192)
+def _quote_memoized(string: str, safe: Optional[str]) -> str:
+    return urllib.parse.quote(urllib.parse.unquote(string), safe=safe)
+
+
+def canonicalize(url: str | URL, keep_fragment: bool = False, query_delimiter: str = "&") -> str:
+    """
+    Get the canonical form of a URL, so that equivalent URLs compare equal as strings.
+
+    The following normalizations are applied:
+    - Scheme and host are lowercased, and default ports (80 for HTTP, 443 for HTTPS) are removed.
+    - Percent-encodings of unreserved characters are decoded,
+      all other percent-encodings are uppercased,
+      and characters that must be percent-encoded are encoded.
+    - Dot segments ('.' and '..') and trailing slashes are removed from the path.
+    - Query fields are sorted, and empty query strings are removed.
+    - The fragment is removed, unless `keep_fragment` is set.
+
+    Parameters
+    ----------
+    url : str | URL
+        The URL to canonicalize.
+    keep_fragment : bool, default: False
+        Whether to keep the fragment (i.e. the part after '#').
+        Fragments are not sent to servers, and thus are usually irrelevant for deduplication.
+    query_delimiter : str, default: '&'
+        Delimiter of the query string.
+
+    Returns
+    -------
+    str
+        The canonical URL.
+    """
+    parts = urllib.parse.urlsplit(str(url))
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.rpartition("@")
+    host, colon, port = netloc[2].rpartition(":")
+    if not colon or "]" in port:
+        host, port = netloc[2], ""
+    host = host.lower()
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if netloc[0]:
+        host = f"{_normalize_percent_encoding(netloc[0], safe="!$&'()*+,;=:")}@{host}"
+    path = _remove_dot_segments(_normalize_percent_encoding(parts.path, safe="/!$&'()*+,;=:@"))
+    canonical = f"{scheme}://{host}{path.rstrip("/")}"
+    if parts.query:
+        fields = sorted(
+            _normalize_percent_encoding(field, safe="!$'()*+,;:@/?=")
+            for field in parts.query.split(query_delimiter)
+            if field
+        )
+        if fields:
+            canonical += f"?{query_delimiter.join(fields)}"
+    if keep_fragment and parts.fragment:
+        canonical += f"#{_normalize_percent_encoding(parts.fragment, safe="!$&'()*+,;=:@/?")}"
+    return canonical
+
+
+def canonical_hash(url: str | URL, keep_fragment: bool = False, query_delimiter: str = "&") -> str:
+    """
+    Get a stable hash of the canonical form of a URL.
+
+    Unlike the built-in `hash`, the result is the same across processes and machines,
+    and can thus be stored and compared between runs.
+
+    Parameters
+    ----------
+    url : str | URL
+        The URL to hash.
+    keep_fragment : bool, default: False
+        Whether to include the fragment in the canonical form; see `canonicalize`.
+    query_delimiter : str, default: '&'
+        Delimiter of the query string.
+
+    Returns
+    -------
+    str
+        A 32-character hexadecimal BLAKE2b digest (128 bits).
+    """
+    canonical = canonicalize(url, keep_fragment=keep_fragment, query_delimiter=query_delimiter)
+    return hashlib.blake2b(canonical.encode("utf8"), digest_size=16).hexdigest()
+
+
+def fingerprint(url: str | URL, keep_fragment: bool = False, query_delimiter: str = "&") -> int:
+    """
+    Get a stable 64-bit fingerprint of the canonical form of a URL.
+
+    Fingerprints are more compact than `canonical_hash`, at the cost of a higher
+    (yet for most purposes negligible) collision probability;
+    for 100 million distinct URLs, the chance of any collision is about 0.03%.
+
+    Parameters
+    ----------
+    url : str | URL
+        The URL to fingerprint.
+    keep_fragment : bool, default: False
+        Whether to include the fragment in the canonical form; see `canonicalize`.
+    query_delimiter : str, default: '&'
+        Delimiter of the query string.
+
+    Returns
+    -------
+    int
+        An unsigned 64-bit integer.
+    """
+    canonical = canonicalize(url, keep_fragment=keep_fragment, query_delimiter=query_delimiter)
+    return int.from_bytes(hashlib.blake2b(canonical.encode("utf8"), digest_size=8).digest(), "big")
+
+
+def deduplicate(
+    urls: Iterable[str | URL],
+    keep_fragment: bool = False,
+    query_delimiter: str = "&",
+) -> Iterator[str | URL]:
+    """
+    Lazily drop URLs that are equivalent to an earlier URL in a stream.
+
+    Only the 64-bit `fingerprint` of each seen URL is kept in memory,
+    so arbitrarily large streams can be deduplicated in a single pass.
+
+    Parameters
+    ----------
+    urls : Iterable[str | URL]
+        The URLs to deduplicate.
+    keep_fragment : bool, default: False
+        Whether URLs differing only in their fragment are considered distinct.
+    query_delimiter : str, default: '&'
+        Delimiter of the query string.
+
+    Yields
+    ------
+    str | URL
+        The first occurrence of each distinct URL, as given in the input.
+    """
+    seen = set()
+    for url in urls:
+        key = fingerprint(url, keep_fragment=keep_fragment, query_delimiter=query_delimiter)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield url
+
+
+def _normalize_percent_encoding(string: str, safe: str) -> str:
+    """Decode unreserved characters, uppercase other percent-encodings, and encode unsafe characters."""
+
+    def normalize(match: re.Match) -> str:
+        char = chr(int(match.group(1), 16))
+        return char if _UNRESERVED_PATTERN.fullmatch(char) else match.group(0).upper()
+
+    if "%" in string:
+        string = _PERCENT_ENCODING_PATTERN.sub(normalize, string)
+    if _UNRESERVED_PATTERN.fullmatch(string):
+        return string
+    return urllib.parse.quote(string, safe=f"{safe}%")
+
+
+def _remove_dot_segments(path: str) -> str:
+    """Remove '.' and '..' segments from a URL path; see RFC 3986, section 5.2.4."""
+    if "." not in path:
+        return path
+    segments = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(segments) > 1:
+                segments.pop()
+        elif segment != ".":
+            segments.append(segment)
+    if path.endswith(("/.", "/..")):
+        segments.append("")
+    return "/".join(segments)
+
+
+class URLMatch(NamedTuple):
+    """
+    A URL found in a document.
+
+    Attributes
+    ----------
+    start : int
+        Offset of the first character (or byte, for binary sources) of the URL in the document.
+    end : int
+        Offset right after the last character (or byte) of the URL in the document.
+    url : URL
+        The parsed URL.
+    """
+
+    start: int
+    end: int
+    url: URL
+
+
+def scan(
+    source: str | bytes | TextIO | BinaryIO,
+    chunk_size: int = 1 << 20,
+    max_url_length: int = 8192,
+) -> Iterator[URLMatch]:
+    """
+    Find and parse all HTTP(S) URLs in a document.
+
+    Streams are read in chunks of `chunk_size`, and URLs are yielded as soon as they are found,
+    so that memory usage is bounded regardless of the document size.
+    Trailing punctuation (e.g. the period at the end of a sentence) is not considered part of a URL,
+    and matches that cannot be parsed by `create` are skipped.
+
+    Parameters
+    ----------
+    source : str | bytes | TextIO | BinaryIO
+        The document, either as a string or bytes (e.g. a memory-mapped file),
+        or a text or binary stream (e.g. an open file).
+        Offsets are in characters for text sources, and in bytes for binary sources.
+    chunk_size : int, default: 1 MiB
+        Number of characters (or bytes) to read from streams at once.
+    max_url_length : int, default: 8192
+        Maximum length of a URL. Longer matches are truncated at chunk boundaries.
+
+    Yields
+    ------
+    URLMatch
+        Offsets and parsed URL of each URL found in the document, in order of appearance.
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        for match in _scan_pattern(source).finditer(source):
+            url_match = _to_url_match(match, offset=0)
+            if url_match:
+                yield url_match
+        return
+    buffer = None
+    offset = 0
+    while True:
+        chunk = source.read(chunk_size)
+        buffer = chunk if buffer is None else buffer + chunk
+        at_eof = not chunk
+        # Keep the tail of the buffer for the next round, as it may hold
+        # a partial 'https://' prefix, or a URL continuing in the next chunk.
+        keep_from = max(len(buffer) - len("https://"), 0)
+        for match in _scan_pattern(buffer).finditer(buffer):
+            if (
+                not at_eof
+                and match.end() == len(buffer)
+                and match.end() - match.start() < max_url_length
+            ):
+                keep_from = match.start()
+                break
+            keep_from = max(keep_from, match.end())
+            url_match = _to_url_match(match, offset=offset)
+            if url_match:
+                yield url_match
+        if at_eof:
+            return
+        buffer = buffer[keep_from:]
+        offset += keep_from
+
+
+def scan_file(
+    filepath: str | Path,
+    use_mmap: bool = True,
+    chunk_size: int = 1 << 20,
+    max_url_length: int = 8192,
+) -> Iterator[URLMatch]:
+    """
+    Find and parse all HTTP(S) URLs in a file; see `scan`.
+
+    Parameters
+    ----------
+    filepath : str | pathlib.Path
+        Path to the file. Offsets of the yielded matches are in bytes.
+    use_mmap : bool, default: True
+        Whether to memory-map the file, instead of reading it in chunks.
+        Either way, the file is never fully loaded into memory.
+    chunk_size : int, default: 1 MiB
+        Number of bytes to read at once, when `use_mmap` is False.
+    max_url_length : int, default: 8192
+        Maximum length of a URL, when `use_mmap` is False.
+
+    Yields
+    ------
+    URLMatch
+        Offsets and parsed URL of each URL found in the file, in order of appearance.
+    """
+    with open(filepath, "rb") as file:
+        if not use_mmap:
+            yield from scan(file, chunk_size=chunk_size, max_url_length=max_url_length)
+            return
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped.
+            return
+        with mapped:
+            yield from scan(mapped)
+    return
+
+
+def _scan_pattern(buffer) -> re.Pattern:
+    return _SCAN_PATTERN_STR if isinstance(buffer, str) else _SCAN_PATTERN_BYTES
+
+
+def _to_url_match(match: re.Match, offset: int) -> URLMatch | None:
+    """Parse a match of a scan pattern, stripping trailing punctuation."""
+    text = match.group()
+    is_bytes = isinstance(text, bytes)
+    text = text.rstrip(_SCAN_TRAILING_PUNCTUATION.encode() if is_bytes else _SCAN_TRAILING_PUNCTUATION)
+    length = len(text)
+    if is_bytes:
+        text = text.decode("utf8", errors="replace")
+    host = text.partition("://")[2]
+    if not host or host[0] in "/?#":
+        # Nothing but the scheme (and punctuation) was matched
+        return
+    try:
+        url = create(text)
+    except ValueError:
+        return
+    start = offset + match.start()
+    return URLMatch(start=start, end=start + length, url=url)
+
+
+class ParseCacheInfo(NamedTuple):
+    """
+    Statistics of the URL parse cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that were answered from the cache.
+    misses : int
+        Number of lookups that required parsing the URL.
+    evictions : int
+        Number of entries that were discarded to keep the cache within `maxsize`.
+    maxsize : int
+        Maximum number of entries held in the cache.
+    currsize : int
+        Current number of entries in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _ParseCache:
+    """A thread-safe, bounded LRU cache for parsed URLs."""
+
+    def __init__(self, maxsize: int = 4096):
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resize(maxsize)
+        return
+
+    def get(self, key: tuple[str, str]):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple[str, str], entry) -> None:
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+        return
+
+    def resize(self, maxsize: int) -> None:
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("`maxsize` must be a non-negative integer.")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+        return
+
+    def info(self) -> ParseCacheInfo:
+        with self._lock:
+            return ParseCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return
+
+
+_parse_cache = _ParseCache()
+
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Get hit, miss and eviction statistics of the URL parse cache used by `create`."""
+    return _parse_cache.info()
+
+
+def parse_cache_clear() -> None:
+    """Remove all entries from the URL parse cache and reset its statistics."""
+    _parse_cache.clear()
+    return
+
+
+def parse_cache_resize(maxsize: int) -> None:
+    """
+    Set the maximum number of entries in the URL parse cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached URLs. Least recently used entries are evicted first.
+        Setting this to 0 disables caching.
+    """
+    _parse_cache.resize(maxsize)
+    return
+
+
 def _process_url(url: str, query_delimiter: str = "&") -> tuple[str, dict[str, str], str]:
     """
     Process a URL and separate the base, query string and fragment.
 
+    Results are memoized in a bounded LRU cache (see `parse_cache_info`),
+    so that repeatedly processing the same URL only costs a dictionary lookup.
+
     Parameters
     ----------
     url : str
@@ -180,9 +933,22 @@ def _process_url(url: str, query_delimiter: str = "&") -> tuple[str, dict[str, s
     -------
     base, queries, fragment : str, dict[str, str], str
     """
+    key = (url, query_delimiter)
+    entry = _parse_cache.get(key)
+    if entry is None:
+        entry = _parse_url(url, query_delimiter=query_delimiter)
+        _parse_cache.put(key, entry)
+    base_url, queries, fragment = entry
+    return base_url, dict(queries), fragment
+
+
+def _parse_url(
+    url: str, query_delimiter: str = "&"
+) -> tuple[str, tuple[tuple[str, str | bool], ...], str | None]:
+    """Parse a URL into its base, query items and fragment, without caching."""
 
     def process_query_string(query_string: str):
-        """Process the query string and return a dictionary of key-value pairs."""
+        """Process the query string and return a tuple of key-value pairs."""
         queries = dict()
         for query in query_string.split(query_delimiter):
             key_val = query.split("=")
@@ -192,12 +958,11 @@ def _process_url(url: str, query_delimiter: str = "&") -> tuple[str, dict[str, s
                 queries[key_val[0]] = key_val[1]
             else:
                 raise ValueError("Query string not formatted correctly.")
-        return queries
+        return tuple(queries.items())
 
     if not url.startswith(("http://", "https://")):
         raise ValueError("`base_url` must start with either 'http://' or 'https://'.")
-    url_pattern = r"^(?P<base_url>[^?#]+)(?:\?(?P<query_string>[^#]+))?(?:#(?P<fragment>.*))?$"
-    match = re.match(url_pattern, url)
+    match = _URL_PATTERN.match(url)
     if not match:
         raise ValueError("URL not formatted correctly.")
     base_url = match.group("base_url")
@@ -205,5 +970,5 @@ def _process_url(url: str, query_delimiter: str = "&") -> tuple[str, dict[str, s
         base_url = base_url[:-1]
     query_string = match.group("query_string")
     fragment = match.group("fragment")
-    queries = process_query_string(query_string) if query_string else dict()
+    queries = process_query_string(query_string) if query_string else tuple()
     return base_url, queries, fragment
@@ -0,0 +1,511 @@
+"""Validate the existence of online resources in bulk.
+
+Site objects (e.g. `pylinks.site.github.Repo`) validate their URLs on creation
+using `validate`. To validate many URLs or site objects at once, use `check_all`,
+which sends lightweight `HEAD` requests (falling back to `GET` when necessary)
+concurrently over pooled connections, while limiting the load on each host.
+
+Results are cached process-wide by canonical URL (see `pylinks.url.canonicalize`),
+and reused for `settings.validation_ttl` seconds if the validation succeeded,
+or `settings.validation_negative_ttl` seconds if it failed definitively
+(i.e. the server responded with a client error status code, e.g. 404 or 410).
+Temporary failures, such as connection errors, timeouts,
+and status codes in `Validator.retry_status_codes`, are never cached.
+The cache is persisted on disk when `settings.cache_dir` is set.
+
+When `settings.deferred_validation` is enabled, site objects do not validate on creation,
+but only register their URLs as pending. All pending URLs are then validated
+together in a concurrent batch, either explicitly by calling `flush`,
+or automatically on first use of any pending site object's `homepage`.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING, NamedTuple as _NamedTuple
+import dataclasses as _dataclasses
+import threading as _threading
+import time as _time
+import urllib.parse as _urllib_parse
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+
+import requests as _requests
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+
+from pylinks._cache import TTLCache as _TTLCache
+from pylinks._settings import settings as _settings
+from pylinks.url import URL as _URL, canonicalize as _canonicalize
+from pylinks.exception.validation import PyLinksLinkValidationError as _PyLinksLinkValidationError
+
+if _TYPE_CHECKING:
+    from typing import Any, Iterable, Sequence
+
+
+class LinkStatus(_NamedTuple):
+    """
+    Result of validating a single URL.
+
+    Attributes
+    ----------
+    url : str
+        The validated URL.
+    ok : bool
+        Whether the resource exists, i.e. the final response had a non-error status code.
+    status_code : int | None
+        Status code of the final response, or None if no response was received.
+    method : str | None
+        HTTP method of the final request, i.e. 'HEAD' or 'GET'.
+    error : str | None
+        Description of the connection error, if no response was received.
+    elapsed : float
+        Total time (in seconds) spent on validating the URL, including retries.
+    """
+
+    url: str
+    ok: bool
+    status_code: int | None = None
+    method: str | None = None
+    error: str | None = None
+    elapsed: float = 0
+
+
+@_dataclasses.dataclass
+class ValidationReport:
+    """
+    Results of validating a batch of URLs.
+
+    Attributes
+    ----------
+    results : list[LinkStatus]
+        Status of each URL, in the same order as the input.
+    """
+
+    results: list[LinkStatus] = _dataclasses.field(default_factory=list)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> LinkStatus:
+        return self.results[index]
+
+    @property
+    def ok(self) -> bool:
+        """Whether all URLs were successfully validated."""
+        return all(status.ok for status in self.results)
+
+    @property
+    def passed(self) -> list[LinkStatus]:
+        """Statuses of successfully validated URLs."""
+        return [status for status in self.results if status.ok]
+
+    @property
+    def failed(self) -> list[LinkStatus]:
+        """Statuses of URLs that failed validation."""
+        return [status for status in self.results if not status.ok]
+
+    def raise_for_status(self) -> None:
+        """Raise a `PyLinksLinkValidationError` if any URL failed validation."""
+        failed = self.failed
+        if failed:
+            raise _PyLinksLinkValidationError(failed)
+        return
+
+
+class Validator:
+    """Concurrent link validator with connection pooling and per-host rate limits."""
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_per_host: int = 4,
+        min_interval_per_host: float = 0,
+        timeout: float | tuple[float, float] = (5, 15),
+        retries: int = 2,
+        retry_status_codes: Sequence[int] = (429, 500, 502, 503, 504),
+        fallback_status_codes: Sequence[int] = (403, 404, 405, 501),
+        headers: dict[str, str] | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_workers : int, default: 16
+            Maximum number of concurrent requests in total.
+        max_per_host : int, default: 4
+            Maximum number of concurrent requests to the same host.
+        min_interval_per_host : float, default: 0
+            Minimum time (in seconds) between the start of two requests to the same host.
+        timeout : float | tuple[float, float], default: (5, 15)
+            Connect and read timeouts of each request (in seconds).
+        retries : int, default: 2
+            Number of times a request is retried after a connection error
+            or a response with a status code in `retry_status_codes`.
+            Retries are delayed exponentially, or according to the 'Retry-After' header.
+        retry_status_codes : Sequence[int], default: (429, 500, 502, 503, 504)
+            Status codes indicating temporary errors.
+        fallback_status_codes : Sequence[int], default: (403, 404, 405, 501)
+            Status codes of `HEAD` responses that trigger a `GET` request,
+            since some servers do not correctly support `HEAD` requests.
+            A `GET` request is also sent when a `HEAD` request fails with a connection error.
+        headers : dict[str, str], optional
+            Additional headers to send with each request.
+        """
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.min_interval_per_host = min_interval_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_status_codes = tuple(retry_status_codes)
+        self.fallback_status_codes = tuple(fallback_status_codes)
+        self._session = _requests.Session()
+        adapter = _HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_per_host * 2)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        if headers:
+            self._session.headers.update(headers)
+        self._hosts_lock = _threading.Lock()
+        self._host_semaphores: dict[str, _threading.BoundedSemaphore] = {}
+        self._host_last_request: dict[str, float] = {}
+        return
+
+    def check(self, target: Any, use_cache: bool = True) -> LinkStatus:
+        """
+        Validate a single URL or site object.
+
+        Parameters
+        ----------
+        target : str | pylinks.url.URL | site object
+            A URL, or an object with a `homepage` attribute (e.g. `pylinks.site.pypi.Package`);
+            objects can override the URL to validate by defining a `validation_url` attribute.
+        use_cache : bool, default: True
+            Whether to reuse a cached result for the URL, if it has not expired.
+            The new result is cached either way, unless it is a temporary failure.
+        """
+        url = _target_url(target)
+        key = _canonicalize(url)
+        if use_cache:
+            cached = _cache.get(key)
+            if cached is not None:
+                return LinkStatus(**cached)._replace(url=url)
+        status = self._check(url)
+        if status.ok:
+            _cache.set(key, status._asdict(), ttl=_settings.validation_ttl)
+        elif self._is_definitive_failure(status):
+            _cache.set(key, status._asdict(), ttl=_settings.validation_negative_ttl)
+        return status
+
+    def check_all(self, targets: Iterable[Any], use_cache: bool = True) -> ValidationReport:
+        """
+        Validate many URLs or site objects concurrently.
+
+        Equivalent URLs (i.e. with the same canonical form) are only requested once.
+
+        Parameters
+        ----------
+        targets : Iterable[str | pylinks.url.URL | site object]
+            URLs or site objects to validate; see `check`.
+        use_cache : bool, default: True
+            Whether to reuse cached results; see `check`.
+
+        Returns
+        -------
+        ValidationReport
+            Status of each target, in the same order as the input.
+        """
+        urls = [_target_url(target) for target in targets]
+        keys = [_canonicalize(url) for url in urls]
+        unique = dict(zip(keys, urls))
+        with _ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            statuses = dict(
+                zip(unique, executor.map(lambda url: self.check(url, use_cache=use_cache), unique.values()))
+            )
+        return ValidationReport(
+            results=[statuses[key]._replace(url=url) for key, url in zip(keys, urls)]
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+        return
+
+    def _is_definitive_failure(self, status: LinkStatus) -> bool:
+        # Only client errors (e.g. 404, 410) are definitive;
+        # connection errors and server errors may be gone on the next try.
+        return (
+            status.error is None
+            and status.status_code is not None
+            and 400 <= status.status_code < 500
+            and status.status_code not in self.retry_status_codes
+        )
+
+    def _check(self, url: str) -> LinkStatus:
+        start = _time.monotonic()
+        host = _urllib_parse.urlsplit(url).netloc.lower()
+        delay = 1
+        for try_count in range(self.retries + 1):
+            with self._host_slot(host):
+                status = self._request(url)
+            is_temporary = status.status_code in self.retry_status_codes or status.error is not None
+            if status.ok or not is_temporary or try_count == self.retries:
+                break
+            _time.sleep(status.retry_after if status.retry_after is not None else delay)
+            delay *= 2
+        return LinkStatus(
+            url=url,
+            ok=status.ok,
+            status_code=status.status_code,
+            method=status.method,
+            error=status.error,
+            elapsed=_time.monotonic() - start,
+        )
+
+    def _request(self, url: str) -> _RequestStatus:
+        status = None
+        for method in ("HEAD", "GET"):
+            try:
+                # With `stream=True`, the body of `GET` responses is not downloaded.
+                with self._session.request(
+                    method, url, timeout=self.timeout, allow_redirects=True, stream=True
+                ) as response:
+                    status = _RequestStatus(
+                        ok=response.ok,
+                        status_code=response.status_code,
+                        method=method,
+                        retry_after=_retry_after(response),
+                    )
+            except _requests.exceptions.RequestException as e:
+                status = _RequestStatus(ok=False, method=method, error=str(e))
+                # Some servers drop the connection on `HEAD` requests;
+                # a connect timeout, however, means the host is unreachable either way.
+                if isinstance(e, _requests.exceptions.ConnectTimeout) or not isinstance(
+                    e, _requests.exceptions.ConnectionError
+                ):
+                    break
+                continue
+            if status.ok or status.status_code not in self.fallback_status_codes:
+                break
+        return status
+
+    def _host_slot(self, host: str):
+        with self._hosts_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._host_semaphores[host] = _threading.BoundedSemaphore(self.max_per_host)
+        return _HostSlot(self, host, semaphore)
+
+
+class _RequestStatus(_NamedTuple):
+    ok: bool
+    status_code: int | None = None
+    method: str | None = None
+    error: str | None = None
+    retry_after: float | None = None
+
+
+class _HostSlot:
+    """Context manager acquiring a per-host request slot, respecting the minimum request interval."""
+
+    def __init__(self, validator: Validator, host: str, semaphore: _threading.BoundedSemaphore):
+        self._validator = validator
+        self._host = host
+        self._semaphore = semaphore
+        return
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        interval = self._validator.min_interval_per_host
+        if interval:
+            with self._validator._hosts_lock:
+                last = self._validator._host_last_request.get(self._host, -interval)
+                start = max(_time.monotonic(), last + interval)
+                self._validator._host_last_request[self._host] = start
+            wait = start - _time.monotonic()
+            if wait > 0:
+                _time.sleep(wait)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+        return False
+
+
+_cache = _TTLCache("validation")
+_pending: dict[str, str] = {}
+_pending_lock = _threading.Lock()
+_flush_lock = _threading.RLock()
+_local = _threading.local()
+_default_validator: Validator | None = None
+_default_validator_lock = _threading.Lock()
+
+
+def default_validator() -> Validator:
+    """The shared validator used by `check`, `check_all`, `validate`, and site objects."""
+    global _default_validator
+    with _default_validator_lock:
+        if _default_validator is None:
+            _default_validator = Validator()
+        return _default_validator
+
+
+def check(target: Any, use_cache: bool = True) -> LinkStatus:
+    """Validate a single URL or site object using the default validator; see `Validator.check`."""
+    return default_validator().check(target, use_cache=use_cache)
+
+
+def check_all(
+    targets: Iterable[Any], validator: Validator | None = None, use_cache: bool = True
+) -> ValidationReport:
+    """
+    Validate many URLs or site objects concurrently; see `Validator.check_all`.
+
+    Parameters
+    ----------
+    targets : Iterable[str | pylinks.url.URL | site object]
+        URLs or site objects to validate.
+    validator : Validator, optional
+        Validator to use. If not provided, the default validator is used.
+    use_cache : bool, default: True
+        Whether to reuse cached results.
+    """
+    return (validator or default_validator()).check_all(targets, use_cache=use_cache)
+
+
+def clear_cache(expired_only: bool = False) -> None:
+    """Remove all (or only expired) cached validation results, both in memory and on disk."""
+    _cache.clear(expired_only=expired_only)
+    return
+
+
+def validate(target: Any, deferred: bool | None = None) -> str | None:
+    """
+    Validate a single URL or site object, and raise an error if it fails.
+
+    Parameters
+    ----------
+    target : str | pylinks.url.URL | site object
+        The URL or site object to validate.
+    deferred : bool, optional
+        Whether to only register the URL as pending, instead of validating it immediately;
+        see `defer`. If None (default), `settings.deferred_validation` is used.
+
+    Returns
+    -------
+    str | None
+        The pending URL if validation was deferred, otherwise None.
+        Pending URLs must be passed to `resolve` before the target is used.
+
+    Raises
+    ------
+    pylinks.exception.validation.PyLinksLinkValidationError
+        If the resource does not exist or cannot be reached.
+    """
+    if deferred or (deferred is None and _settings.deferred_validation):
+        return defer(target)
+    status = check(target)
+    if not status.ok:
+        raise _PyLinksLinkValidationError([status])
+    return
+
+
+def defer(target: Any) -> str:
+    """
+    Register a URL or site object as pending validation.
+
+    Returns
+    -------
+    str
+        The pending URL.
+    """
+    # Getting the URL of a site object may involve other pending objects
+    # (e.g. the user of a repository), which must not be resolved here.
+    _local.deferring = getattr(_local, "deferring", 0) + 1
+    try:
+        url = _target_url(target)
+    finally:
+        _local.deferring -= 1
+    with _pending_lock:
+        _pending.setdefault(_canonicalize(url), url)
+    return url
+
+
+def pending() -> list[str]:
+    """URLs that are pending validation."""
+    with _pending_lock:
+        return list(_pending.values())
+
+
+def flush(validator: Validator | None = None) -> ValidationReport:
+    """
+    Validate all pending URLs concurrently.
+
+    Failures are not raised here, but when the corresponding site objects are used
+    (or by calling `raise_for_status` on the returned report).
+
+    Parameters
+    ----------
+    validator : Validator, optional
+        Validator to use. If not provided, the default validator is used.
+
+    Returns
+    -------
+    ValidationReport
+        Status of each pending URL.
+    """
+    with _flush_lock:
+        with _pending_lock:
+            urls = list(_pending.values())
+        report = check_all(urls, validator=validator)
+        with _pending_lock:
+            for url in urls:
+                _pending.pop(_canonicalize(url), None)
+    return report
+
+
+def resolve(url: str) -> str | None:
+    """
+    Complete the validation of a URL returned by `validate` or `defer`.
+
+    If the URL is still pending, all pending URLs are validated in a batch (see `flush`).
+
+    Returns
+    -------
+    str | None
+        None, or the URL itself if it is to remain pending,
+        i.e. when called while another URL is being deferred.
+
+    Raises
+    ------
+    pylinks.exception.validation.PyLinksLinkValidationError
+        If the resource does not exist or cannot be reached.
+    """
+    if getattr(_local, "deferring", 0):
+        return url
+    key = _canonicalize(url)
+    with _flush_lock:
+        with _pending_lock:
+            is_pending = key in _pending
+        if is_pending:
+            flush()
+    status = check(url)
+    if not status.ok:
+        raise _PyLinksLinkValidationError([status])
+    return
+
+
+def _target_url(target: Any) -> str:
+    if isinstance(target, (str, _URL)):
+        return str(target)
+    url = getattr(target, "validation_url", None) or getattr(target, "homepage", None)
+    if url is None:
+        raise TypeError(
+            f"Validation target must be a URL or have a `homepage` attribute, not {type(target)}."
+        )
+    return str(url)
+
+
+def _retry_after(response: _requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None or not value.isdigit():
+        return
+    return min(float(value), 60)